@@ -1,6 +1,5 @@
 # app.py (UPDATED WITH BALANCE MONITORING)
 from __future__ import annotations
-import asyncio
 import logging
 
 from telegram.ext import ApplicationBuilder, Application
@@ -19,7 +18,13 @@ logger = logging.getLogger(__name__)
 
 def build_application() -> Application:
     settings = load_settings()
-    app = ApplicationBuilder().token(settings.telegram_token).build()
+    app = (
+        ApplicationBuilder()
+        .token(settings.telegram_token)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
 
     # Register handlers
     register_core_handlers(app, settings)
@@ -28,9 +33,8 @@ def build_application() -> Application:
     register_report_handlers(app, settings)
     register_captcha_handlers(app)
 
-    # Attach shared objects
-    loop = asyncio.get_event_loop()
-    app.bot_data["messenger"] = Messenger(bot=app.bot, chat_id=settings.telegram_chat_id, loop=loop, debug=True)
+    # Attach shared objects (messenger binds to PTB's loop in post_init)
+    app.bot_data["messenger"] = Messenger(bot=app.bot, chat_id=settings.telegram_chat_id, loop=None, debug=True)
     app.bot_data["settings"] = settings
     app.bot_data["creds_by_alias"] = load_creds(settings.credentials_csv)
     app.bot_data["workers"] = {}
@@ -43,13 +47,23 @@ def build_application() -> Application:
     )
     app.bot_data["balance_monitor"] = balance_monitor
     
-    logger.info("Application built successfully")
+    # Each register_* call above is the only place its handlers are added;
+    # log the total so accidental double registration shows up at startup.
+    logger.info(
+        "Application built successfully (%d handlers registered)",
+        sum(len(group) for group in app.handlers.values()),
+    )
     return app
 
 async def post_init(application: Application) -> None:
     """Called after the application starts."""
     logger.info("Starting post-initialization tasks...")
     
+    # Bind messenger to the application's running loop so worker threads can use it
+    messenger = application.bot_data.get("messenger")
+    if messenger:
+        await messenger.bind_loop()
+    
     # Start balance monitor
     balance_monitor = application.bot_data.get("balance_monitor")
     if balance_monitor:
@@ -79,12 +93,8 @@ def main() -> None:
     
     app = build_application()
     
-    # Register lifecycle callbacks
-    app.post_init = post_init
-    app.post_shutdown = post_shutdown
-    
     logger.info("✅ Autobot V2 ready - starting polling...")
-    app.run_polling(allowed_updates=["message", "callback_query"])
+    app.run_polling(allowed_updates=["message", "callback_query"], timeout=30)
 
 if __name__ == "__main__":
     main()
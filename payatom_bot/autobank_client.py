@@ -7,25 +7,41 @@ from selenium.webdriver.support import expected_conditions as EC
 #All Bank Workers will use this code to upload files to autobank, so be carefull when changing this. 
 # Have to change the code here when endpoint is generated. Comment all current code when that happens.
 class AutoBankClient:
+    # Locators, bound once instead of rebuilt on every upload
+    _SIDEBAR = (By.ID, "sidebar")
+    _SIGNIN_XPATH = (
+        By.XPATH,
+        "//a[contains(@class,'auth-form-btn')] | //button[contains(@onclick,'getToken') or normalize-space()='Sign In' or normalize-space()='SIGN IN']"
+    )
+    _DROP_ZONE = (By.ID, "drop-zone")
+    _BANK = (By.ID, "bank")
+    _ACCT = (By.ID, "account_number")
+    _FILE = (By.ID, "file_input")
+    _SUCCESS_CSS = (By.CSS_SELECTOR, ".swal2-icon-success")
+    _BODY = (By.TAG_NAME, "body")
+
     def __init__(self, driver, wait_secs: int = 20):
         self.driver = driver
         self.wait = WebDriverWait(driver, wait_secs)
+        # Wait for a common success condition; adjust selectors per the page.
+        # Sometimes autobank has issues with showing the favicon so cannot rely on this alone. 
+        self._wait_success = EC.any_of(
+            EC.visibility_of_element_located(self._SUCCESS_CSS),
+            EC.text_to_be_present_in_element(self._BODY, "Upload successful")
+        )
 
     def ensure_logged_in(self) -> None:
         d = self.driver
         d.get("https://autostatement.ipay365.net/operator_index.php")
         try:
-            self.wait.until(EC.presence_of_element_located((By.ID, "sidebar")))
+            self.wait.until(EC.presence_of_element_located(self._SIDEBAR))
             return
         except TimeoutException:
             pass
         try:
-            btn = self.wait.until(EC.element_to_be_clickable((
-                By.XPATH,
-                "//a[contains(@class,'auth-form-btn')] | //button[contains(@onclick,'getToken') or normalize-space()='Sign In' or normalize-space()='SIGN IN']"
-            )))
+            btn = self.wait.until(EC.element_to_be_clickable(self._SIGNIN_XPATH))
             ActionChains(d).move_to_element(btn).pause(0.05).click(btn).perform()
-            self.wait.until(EC.presence_of_element_located((By.ID, "sidebar")))
+            self.wait.until(EC.presence_of_element_located(self._SIDEBAR))
         except TimeoutException:
             # Already logged or different layout; continue
             pass
@@ -35,19 +51,12 @@ class AutoBankClient:
         self.ensure_logged_in()
         d.get("https://autostatement.ipay365.net/bankupload.php")
 
-        self.wait.until(EC.presence_of_element_located((By.ID, "drop-zone")))
-        Select(self.wait.until(EC.presence_of_element_located((By.ID, "bank")))).select_by_visible_text(bank_label)
+        self.wait.until(EC.presence_of_element_located(self._DROP_ZONE))
+        Select(self.wait.until(EC.presence_of_element_located(self._BANK))).select_by_visible_text(bank_label)
 
-        acct = self.wait.until(EC.presence_of_element_located((By.ID, "account_number")))
+        acct = self.wait.until(EC.presence_of_element_located(self._ACCT))
         acct.clear(); acct.send_keys(account_number)
 
-        self.wait.until(EC.presence_of_element_located((By.ID, "file_input"))).send_keys(file_path)
+        self.wait.until(EC.presence_of_element_located(self._FILE)).send_keys(file_path)
 
-        # Wait for a common success condition; adjust selectors per the page.
-        # Sometimes autobank has issues with showing the favicon so cannot rely on this alone. 
-        self.wait.until(
-            EC.any_of(
-                EC.visibility_of_element_located((By.CSS_SELECTOR, ".swal2-icon-success")),
-                EC.text_to_be_present_in_element((By.TAG_NAME, "body"), "Upload successful")
-            )
-        )
+        self.wait.until(self._wait_success)
@@ -15,11 +15,13 @@ Threshold Levels:
 from __future__ import annotations
 
 import asyncio
+import bisect
 import logging
 import re
+import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Set, Optional
+from typing import Dict, List, Set, Optional, Sequence, Tuple
 
 from telegram import Bot
 from telegram.constants import ParseMode
@@ -82,6 +84,16 @@ THRESHOLDS = [
     ),
 ]
 
+# Sorted threshold amounts for bisect lookups in the monitor loop
+_THRESHOLD_AMOUNTS = tuple(t.amount for t in THRESHOLDS)
+_THRESHOLDS_TUPLE = tuple(THRESHOLDS)
+
+
+# Balance parsing patterns (compiled once; used on every monitor cycle)
+_CURRENCY_RE = re.compile(r'[₹$€£INR\s,]')
+_SUFFIX_RE = re.compile(r'\s*(CR|DR|CREDIT|DEBIT)\s*$', re.IGNORECASE)
+_NUM_RE = re.compile(r'[\d.]+')
+
 
 def parse_balance_amount(balance_str: str) -> Optional[float]:
     """
@@ -102,63 +114,48 @@ def parse_balance_amount(balance_str: str) -> Optional[float]:
     if not balance_str:
         return None
     
-    try:
-        # Remove currency symbols and common text
-        cleaned = balance_str.upper()
-        cleaned = re.sub(r'[₹$€£INR\s,]', '', cleaned)
-        
-        # Handle formats like "12345.67 CR" or "12345.67 DR"
-        cleaned = re.sub(r'\s*(CR|DR|CREDIT|DEBIT)\s*$', '', cleaned, flags=re.IGNORECASE)
-        
-        # Extract first number (handles "Available: 12345.67" etc)
-        match = re.search(r'[\d.]+', cleaned)
-        if match:
-            return float(match.group())
-            
+    # Remove currency symbols and common text
+    cleaned = _CURRENCY_RE.sub('', balance_str.upper())
+    
+    # Handle formats like "12345.67 CR" or "12345.67 DR"
+    cleaned = _SUFFIX_RE.sub('', cleaned)
+    
+    # Extract first number (handles "Available: 12345.67" etc)
+    match = _NUM_RE.search(cleaned)
+    if not match:
         return None
-    except (ValueError, AttributeError):
+    
+    try:
+        return float(match.group())
+    except ValueError:
         return None
 
 
-def format_alert_message(
-    alias: str,
-    balance: float,
-    threshold: BalanceThreshold,
-    account_number: str = "",
-    bank_label: str = "",
-    is_repeat: bool = False,
-) -> str:
+def _alert_tier(amount: int) -> int:
+    """Bucket a threshold amount into the message tier used for styling."""
+    if amount >= 100_000:
+        return 100
+    if amount >= 90_000:
+        return 90
+    if amount >= 70_000:
+        return 70
+    return 0
+
+
+# Shared message scaffolding
+_BAR = "<b>━━━━━━━━━━━━━━━━━━━</b>\n"
+_SEPARATOR = _BAR + "<b>{title}</b>\n" + _BAR + "\n"
+
+
+def _build_alert_template(tier: int, is_repeat: bool) -> str:
     """
-    Format professional alert message with appropriate urgency level.
+    Build the static HTML scaffold for one (tier, is_repeat) combination.
     
-    Args:
-        alias: Account alias
-        balance: Current balance
-        threshold: Triggered threshold configuration
-        account_number: Account number (optional)
-        bank_label: Bank name (optional)
-        is_repeat: Whether this is a repeated alert
-        
-    Returns:
-        Formatted HTML message for Telegram
+    The result is a ``str.format`` template; per-alert values are filled in
+    by ``format_alert_message``.
     """
-    timestamp = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-    
-    # Format balance with Indian number system (lakhs, thousands)
-    balance_formatted = f"₹{balance:,.2f}"
-    threshold_formatted = f"₹{threshold.amount:,.0f}"
-    
-    # Mask account number
-    if account_number:
-        if len(account_number) > 4:
-            masked_account = "****" + account_number[-4:]
-        else:
-            masked_account = account_number
-    else:
-        masked_account = "N/A"
-    
     # Build header based on urgency
-    if threshold.amount >= 100_000:
+    if tier == 100:
         header = (
             "🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨🚨\n"
             "🔴 <b>CRITICAL BALANCE ALERT</b> 🔴\n"
@@ -166,8 +163,7 @@ def format_alert_message(
         )
         if is_repeat:
             header += "<b>⚠️ REPEATED ALERT - STILL CRITICAL ⚠️</b>\n"
-        header += "\n"
-    elif threshold.amount >= 90_000:
+    elif tier == 90:
         header = (
             "🚨🚨🚨🚨🚨🚨🚨🚨🚨\n"
             "🔴 <b>HIGH PRIORITY ALERT</b> 🔴\n"
@@ -175,8 +171,7 @@ def format_alert_message(
         )
         if is_repeat:
             header += "<b>⚠️ REPEATED - STILL HIGH PRIORITY ⚠️</b>\n"
-        header += "\n"
-    elif threshold.amount >= 70_000:
+    elif tier == 70:
         header = (
             "⚠️⚠️⚠️⚠️⚠️⚠️⚠️\n"
             "🟠 <b>URGENT ALERT</b> 🟠\n"
@@ -184,96 +179,180 @@ def format_alert_message(
         )
         if is_repeat:
             header += "<b>🔁 REPEATED ALERT 🔁</b>\n"
-        header += "\n"
     else:
-        header = f"{threshold.emoji} <b>Balance Alert</b> {threshold.emoji}\n"
+        header = "{emoji} <b>Balance Alert</b> {emoji}\n"
         if is_repeat:
             header += "<i>🔁 Repeated Alert</i>\n"
-        header += "\n"
+    header += "\n"
     
     # Account details section
     details = (
-        f"<b>━━━━━━━━━━━━━━━━━━━</b>\n"
-        f"<b>📌 Account Details:</b>\n"
-        f"<b>━━━━━━━━━━━━━━━━━━━</b>\n\n"
-        f"<b>🏷️ Alias:</b> <code>{alias}</code>\n"
-    )
-    
-    if bank_label:
-        details += f"<b>🏦 Bank:</b> {bank_label}\n"
-    
-    details += (
-        f"<b>🔢 Account:</b> <code>{masked_account}</code>\n"
-        f"<b>🕐 Time:</b> {timestamp}\n\n"
+        _SEPARATOR.format(title="📌 Account Details:")
+        + "<b>🏷️ Alias:</b> <code>{alias}</code>\n"
+        "{bank_line}"
+        "<b>🔢 Account:</b> <code>{masked_account}</code>\n"
+        "<b>🕐 Time:</b> {timestamp}\n\n"
     )
     
     # Balance information with emphasis
-    if threshold.amount >= 100_000:
+    if tier == 100:
         balance_section = (
-            f"<b>━━━━━━━━━━━━━━━━━━━</b>\n"
-            f"<b>💰 BALANCE STATUS:</b>\n"
-            f"<b>━━━━━━━━━━━━━━━━━━━</b>\n\n"
-            f"<b>🔴 Current Balance:</b> <code>{balance_formatted}</code>\n"
-            f"<b>⚠️ Threshold Crossed:</b> <code>{threshold_formatted}</code>\n"
-            f"<b>📊 Excess Amount:</b> <code>₹{balance - threshold.amount:,.2f}</code>\n\n"
+            _SEPARATOR.format(title="💰 BALANCE STATUS:")
+            + "<b>🔴 Current Balance:</b> <code>{balance_formatted}</code>\n"
+            "<b>⚠️ Threshold Crossed:</b> <code>{threshold_formatted}</code>\n"
+            "<b>📊 Excess Amount:</b> <code>{excess}</code>\n\n"
         )
     else:
         balance_section = (
-            f"<b>━━━━━━━━━━━━━━━━━━━</b>\n"
-            f"<b>💰 Balance Information:</b>\n"
-            f"<b>━━━━━━━━━━━━━━━━━━━</b>\n\n"
-            f"<b>Current Balance:</b> <code>{balance_formatted}</code>\n"
-            f"<b>Threshold Crossed:</b> <code>{threshold_formatted}</code>\n"
-            f"<b>Excess Amount:</b> <code>₹{balance - threshold.amount:,.2f}</code>\n\n"
+            _SEPARATOR.format(title="💰 Balance Information:")
+            + "<b>Current Balance:</b> <code>{balance_formatted}</code>\n"
+            "<b>Threshold Crossed:</b> <code>{threshold_formatted}</code>\n"
+            "<b>Excess Amount:</b> <code>{excess}</code>\n\n"
         )
     
     # Urgency level
     urgency_section = (
-        f"<b>━━━━━━━━━━━━━━━━━━━</b>\n"
-        f"<b>🚦 Alert Level:</b>\n"
-        f"<b>━━━━━━━━━━━━━━━━━━━</b>\n\n"
-        f"{threshold.urgency}\n\n"
+        _SEPARATOR.format(title="🚦 Alert Level:")
+        + "{urgency}\n\n"
     )
     
     # Required actions
     action_section = (
-        f"<b>━━━━━━━━━━━━━━━━━━━</b>\n"
-        f"<b>📋 Required Action:</b>\n"
-        f"<b>━━━━━━━━━━━━━━━━━━━</b>\n\n"
-        f"{threshold.action_required}\n\n"
+        _SEPARATOR.format(title="📋 Required Action:")
+        + "{action_required}\n\n"
     )
     
     # Footer
-    if threshold.amount >= 100_000:
+    if tier == 100:
         footer = (
-            "<b>━━━━━━━━━━━━━━━━━━━</b>\n"
-            "🚨 <b>THIS IS AN AUTOMATED CRITICAL ALERT</b> 🚨\n"
+            _BAR
+            + "🚨 <b>THIS IS AN AUTOMATED CRITICAL ALERT</b> 🚨\n"
             "🔴 <b>IMMEDIATE MANUAL INTERVENTION REQUIRED</b> 🔴\n"
         )
         if is_repeat:
             footer += "⚠️ <b>ALERT REPEATING EVERY 5 MINUTES</b> ⚠️\n"
-        footer += "<b>━━━━━━━━━━━━━━━━━━━</b>"
-    elif threshold.amount >= 90_000:
+    elif tier == 90:
         footer = (
-            "<b>━━━━━━━━━━━━━━━━━━━</b>\n"
-            "⚠️ <b>Automated High Priority Alert</b> ⚠️\n"
+            _BAR
+            + "⚠️ <b>Automated High Priority Alert</b> ⚠️\n"
             "Please take immediate action\n"
         )
         if is_repeat:
             footer += "🔁 <i>Repeating every 5 minutes until resolved</i>\n"
-        footer += "<b>━━━━━━━━━━━━━━━━━━━</b>"
     else:
         footer = (
-            "<b>━━━━━━━━━━━━━━━━━━━</b>\n"
-            "ℹ️ <i>Automated Balance Monitoring System</i>\n"
+            _BAR
+            + "ℹ️ <i>Automated Balance Monitoring System</i>\n"
         )
         if is_repeat:
             footer += "🔁 <i>Alert repeats every 5 min until balance drops</i>\n"
-        footer += "<b>━━━━━━━━━━━━━━━━━━━</b>"
+    footer += _BAR.rstrip("\n")
     
     return header + details + balance_section + urgency_section + action_section + footer
 
 
+# Alert message templates keyed by (tier, is_repeat), built once at import
+_TEMPLATES: Dict[Tuple[int, bool], str] = {
+    (tier, is_repeat): _build_alert_template(tier, is_repeat)
+    for tier in (100, 90, 70, 0)
+    for is_repeat in (False, True)
+}
+
+
+def format_alert_message(
+    alias: str,
+    balance: float,
+    threshold: BalanceThreshold,
+    account_number: str = "",
+    bank_label: str = "",
+    is_repeat: bool = False,
+) -> str:
+    """
+    Format professional alert message with appropriate urgency level.
+    
+    Args:
+        alias: Account alias
+        balance: Current balance
+        threshold: Triggered threshold configuration
+        account_number: Account number (optional)
+        bank_label: Bank name (optional)
+        is_repeat: Whether this is a repeated alert
+        
+    Returns:
+        Formatted HTML message for Telegram
+    """
+    timestamp = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+    
+    # Mask account number
+    if account_number:
+        if len(account_number) > 4:
+            masked_account = "****" + account_number[-4:]
+        else:
+            masked_account = account_number
+    else:
+        masked_account = "N/A"
+    
+    template = _TEMPLATES[(_alert_tier(threshold.amount), is_repeat)]
+    
+    # Format balance with Indian number system (lakhs, thousands)
+    return template.format(
+        emoji=threshold.emoji,
+        alias=alias,
+        bank_line=f"<b>🏦 Bank:</b> {bank_label}\n" if bank_label else "",
+        masked_account=masked_account,
+        timestamp=timestamp,
+        balance_formatted=f"₹{balance:,.2f}",
+        threshold_formatted=f"₹{threshold.amount:,.0f}",
+        excess=f"₹{balance - threshold.amount:,.2f}",
+        urgency=threshold.urgency,
+        action_required=threshold.action_required,
+    )
+
+
+def _snapshot_workers(
+    workers_registry: Dict[str, object],
+) -> List[Tuple[str, str, str, str]]:
+    """
+    Take a one-pass snapshot of live workers that have reported a balance.
+    
+    Args:
+        workers_registry: Reference to bot_data["workers"] dictionary
+        
+    Returns:
+        List of (alias, balance_str, account_number, bank_label) tuples
+    """
+    out: List[Tuple[str, str, str, str]] = []
+    for alias, worker in list(workers_registry.items()):
+        try:
+            try:
+                alive = worker.is_alive()
+            except AttributeError:
+                continue
+            if not alive:
+                continue
+            
+            try:
+                balance_str = worker.last_balance
+            except AttributeError:
+                continue
+            if not balance_str:
+                continue
+            
+            try:
+                cred = worker.cred or {}
+            except AttributeError:
+                cred = {}
+            out.append((
+                alias,
+                balance_str,
+                cred.get('account_number', ''),
+                cred.get('bank_label', ''),
+            ))
+        except Exception as e:
+            logger.exception("Error reading worker state for %s: %s", alias, e)
+    return out
+
+
 class BalanceMonitor:
     """
     Monitors worker balances and sends alerts when thresholds are crossed.
@@ -284,8 +363,9 @@ class BalanceMonitor:
     def __init__(
         self,
         bot: Bot,
-        alert_group_ids: list[int],
+        alert_group_ids: Sequence[int],
         check_interval: int = 180,
+        max_interval: int = 600,
     ):
         """
         Initialize balance monitor.
@@ -294,22 +374,35 @@ class BalanceMonitor:
             bot: Telegram bot instance
             alert_group_ids: List of Telegram group IDs to send alerts to
             check_interval: Seconds between balance checks (default: 180 = 3 minutes)
+            max_interval: Upper bound on the backed-off interval when all balances are low
         """
         self.bot = bot
-        self.alert_group_ids = alert_group_ids or []
+        self.alert_group_ids = tuple(alert_group_ids or ())
+        self._group_id_strs = tuple(str(g) for g in self.alert_group_ids)
         self.check_interval = check_interval
+        self.max_interval = max(max_interval, check_interval)
+        
+        # Highest balance seen in the last check (drives the adaptive interval)
+        self._last_max_balance = 0.0
         
         # Track which thresholds have been triggered for each alias
         self.triggered_thresholds: Dict[str, Set[int]] = {}
         
-        # Track last alert time per alias (for repeated alerts every 5 min)
-        self.last_alert_time: Dict[str, datetime] = {}
+        # Track last alert time per alias (for repeated alerts every 5 min).
+        # Values are time.monotonic() readings so wall-clock jumps don't skew repeats.
+        self.last_alert_time: Dict[str, float] = {}
+        
+        # Last parsed balance per alias: alias -> (balance_str, parsed value)
+        self._parse_cache: Dict[str, Tuple[str, Optional[float]]] = {}
         
         # Alert repeat interval (5 minutes)
         self.alert_repeat_interval = 300  # 5 minutes in seconds
         
         # Task handle for monitoring
         self._task: Optional[asyncio.Task] = None
+        
+        # Strong references to in-flight alert sends so they can't be GC'd mid-send
+        self._inflight: Set[asyncio.Task] = set()
         self._running = False
         
         logger.info(
@@ -354,6 +447,9 @@ class BalanceMonitor:
             except asyncio.CancelledError:
                 pass
         
+        for task in list(self._inflight):
+            task.cancel()
+        
         logger.info("Balance monitor stopped")
     
     async def _monitor_loop(self, workers_registry: Dict[str, object]) -> None:
@@ -370,45 +466,64 @@ class BalanceMonitor:
             
             # Wait for next check interval
             try:
-                await asyncio.sleep(self.check_interval)
+                await asyncio.sleep(self._next_interval())
             except asyncio.CancelledError:
                 break
         
         logger.info("Balance monitor loop stopped")
     
+    def _next_interval(self) -> int:
+        """
+        Pick the sleep before the next check from the last highest balance.
+        
+        Tightens to at most 60s near critical levels (≥ ₹90,000) and backs
+        off to twice the configured interval (capped at max_interval) only
+        while every account is below the lowest alert threshold.
+        """
+        max_balance = self._last_max_balance
+        if max_balance >= 90_000:
+            return min(60, self.check_interval)
+        if max_balance < _THRESHOLD_AMOUNTS[0]:
+            return min(self.check_interval * 2, self.max_interval)
+        return self.check_interval
+    
     async def _check_all_balances(self, workers_registry: Dict[str, object]) -> None:
         """Check balances for all running workers."""
+        self._last_max_balance = 0.0
+        
+        if not self.alert_group_ids:
+            # Nowhere to send alerts; skip parsing and threshold work entirely
+            return
+        
         if not workers_registry:
+            self._parse_cache.clear()
             return
         
         checked_count = 0
         alert_count = 0
+        alert_tasks: List[asyncio.Task] = []
         
-        for alias, worker in list(workers_registry.items()):
+        for alias, balance_str, account_number, bank_label in _snapshot_workers(workers_registry):
             try:
-                # Check if worker is alive
-                if not hasattr(worker, 'is_alive') or not worker.is_alive():
-                    continue
-                
-                # Get balance
-                balance_str = getattr(worker, 'last_balance', None)
-                if not balance_str:
-                    continue
-                
                 checked_count += 1
                 
-                # Parse balance
-                balance = parse_balance_amount(balance_str)
+                # Parse balance (reuse last result while the worker's string is unchanged)
+                cached = self._parse_cache.get(alias)
+                if cached is not None and cached[0] is balance_str:
+                    balance = cached[1]
+                else:
+                    balance = parse_balance_amount(balance_str)
+                    self._parse_cache[alias] = (balance_str, balance)
                 if balance is None:
                     logger.debug("Could not parse balance for %s: %s", alias, balance_str)
                     continue
                 
+                if balance > self._last_max_balance:
+                    self._last_max_balance = balance
+                
                 # Find the HIGHEST threshold that balance has crossed
-                current_threshold = None
-                for threshold in reversed(THRESHOLDS):  # Check from highest to lowest
-                    if balance >= threshold.amount:
-                        current_threshold = threshold
-                        break
+                idx = bisect.bisect_right(_THRESHOLD_AMOUNTS, balance) - 1
+                current_threshold = _THRESHOLDS_TUPLE[idx] if idx >= 0 else None
                 
                 # If balance is below ALL thresholds, auto-clear tracking
                 if current_threshold is None:
@@ -423,7 +538,7 @@ class BalanceMonitor:
                     continue
                 
                 # Balance is above a threshold - check if we should send alert
-                now = datetime.now()
+                now = time.monotonic()
                 last_alert = self.last_alert_time.get(alias)
                 
                 should_send_alert = False
@@ -439,7 +554,7 @@ class BalanceMonitor:
                     )
                 else:
                     # Check if 5 minutes have passed since last alert
-                    time_since_last = (now - last_alert).total_seconds()
+                    time_since_last = now - last_alert
                     if time_since_last >= self.alert_repeat_interval:
                         should_send_alert = True
                         logger.info(
@@ -451,8 +566,20 @@ class BalanceMonitor:
                         )
                 
                 if should_send_alert:
-                    # Send alert
-                    await self._send_alert(alias, balance, current_threshold, worker)
+                    # Dispatch alert; alerts for different aliases overlap
+                    task = asyncio.create_task(
+                        self._send_alert(
+                            alias,
+                            balance,
+                            current_threshold,
+                            account_number,
+                            bank_label,
+                            is_repeat=last_alert is not None,
+                        )
+                    )
+                    self._inflight.add(task)
+                    task.add_done_callback(self._inflight.discard)
+                    alert_tasks.append(task)
                     
                     # Update tracking
                     self.last_alert_time[alias] = now
@@ -465,6 +592,17 @@ class BalanceMonitor:
             except Exception as e:
                 logger.exception("Error checking balance for %s: %s", alias, e)
         
+        # Wait for this cycle's alerts before the loop goes back to sleep
+        if alert_tasks:
+            results = await asyncio.gather(*alert_tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("Error sending balance alert: %s", result, exc_info=result)
+        
+        # Drop cached parses for workers that are no longer registered
+        for alias in [a for a in self._parse_cache if a not in workers_registry]:
+            del self._parse_cache[alias]
+        
         if checked_count > 0:
             logger.debug(
                 "Balance check complete: %d workers checked, %d alerts sent",
@@ -477,20 +615,14 @@ class BalanceMonitor:
         alias: str,
         balance: float,
         threshold: BalanceThreshold,
-        worker: object,
+        account_number: str = "",
+        bank_label: str = "",
+        *,
+        is_repeat: bool = False,
     ) -> None:
         """Send alert to all configured groups."""
-        # Get additional worker details if available
-        account_number = ""
-        bank_label = ""
-        
-        if hasattr(worker, 'cred'):
-            cred = getattr(worker, 'cred', {})
-            account_number = cred.get('account_number', '')
-            bank_label = cred.get('bank_label', '')
-        
-        # Check if this is a repeated alert
-        is_repeat = alias in self.last_alert_time
+        if not self.alert_group_ids:
+            return
         
         # Format message
         message = format_alert_message(
@@ -502,30 +634,38 @@ class BalanceMonitor:
             is_repeat=is_repeat,
         )
         
-        # Send to all alert groups
-        for group_id in self.alert_group_ids:
-            try:
-                await self.bot.send_message(
+        # Send to all alert groups concurrently
+        results = await asyncio.gather(
+            *(
+                self.bot.send_message(
                     chat_id=group_id,
                     text=message,
                     parse_mode=ParseMode.HTML,
                     disable_web_page_preview=True,
                 )
-                alert_type = "REPEAT" if is_repeat else "NEW"
+                for group_id in self.alert_group_ids
+            ),
+            return_exceptions=True,
+        )
+        
+        alert_type = "REPEAT" if is_repeat else "NEW"
+        for group_id, result in zip(self._group_id_strs, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to send alert to group %s: %s",
+                    group_id,
+                    result,
+                    exc_info=result,
+                )
+            else:
                 logger.info(
-                    "Sent %s %s alert for %s (₹%.2f) to group %d",
+                    "Sent %s %s alert for %s (₹%.2f) to group %s",
                     alert_type,
                     threshold.urgency,
                     alias,
                     balance,
                     group_id,
                 )
-            except Exception as e:
-                logger.exception(
-                    "Failed to send alert to group %d: %s",
-                    group_id,
-                    e,
-                )
     
     def reset_alerts_for_alias(self, alias: str) -> None:
         """
@@ -545,6 +685,8 @@ class BalanceMonitor:
             "running": self._running,
             "alert_groups": len(self.alert_group_ids),
             "check_interval": self.check_interval,
+            "next_interval": self._next_interval(),
+            "last_max_balance": self._last_max_balance,
             "monitored_aliases": len(self.triggered_thresholds),
             "total_alerts": sum(len(t) for t in self.triggered_thresholds.values()),
             "repeat_interval": self.alert_repeat_interval,
@@ -1,7 +1,6 @@
 from __future__ import annotations
-import base64
+import threading
 import time
-import requests
 from typing import Tuple, Optional
 # 2CCaptcha API code that pings the 2Captcha service to solve captchas.
 # 2Caotcha wrong captcha reporting is not working sometimes, have to check later.
@@ -9,6 +8,25 @@ from typing import Tuple, Optional
 class TwoCaptcha:
     def __init__(self, api_key: str) -> None:
         self.key = api_key
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    def _http(self):
+        """
+        Return this client's keep-alive session, creating it on first use.
+        `requests` is imported here so importing this module stays cheap.
+        """
+        if self._session is None:
+            # One client is shared by all worker threads
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+                    self._session = session
+        return self._session
 
     def solve(
         self,
@@ -22,9 +40,8 @@ class TwoCaptcha:
         Returns (solution_text, captcha_id) or (None, None)
         """
         data = {
-            "method": "base64",
+            "method": "post",
             "key": self.key,
-            "body": base64.b64encode(image_bytes).decode(),
             "json": 1
         }
         if regsense:
@@ -34,17 +51,21 @@ class TwoCaptcha:
         if max_len:
             data["max_len"] = max_len
 
-        r = requests.post("http://2captcha.com/in.php", data=data, timeout=30)
+        # Upload raw bytes as multipart instead of a base64 form field
+        files = {"file": ("captcha.png", image_bytes, "image/png")}
+        r = self._http().post("http://2captcha.com/in.php", data=data, files=files, timeout=30)
         r.raise_for_status()
         jin = r.json()
         if jin.get("status") != 1:
             return None, None
 
         cid = str(jin["request"])
-        # poll
-        for _ in range(30):
-            time.sleep(5)
-            res = requests.get(
+        # poll: first check after 10s (typical solve time), then every 3s (~150s total)
+        time.sleep(10)
+        for attempt in range(47):
+            if attempt:
+                time.sleep(3)
+            res = self._http().get(
                 "http://2captcha.com/res.php",
                 params={"key": self.key, "action": "get", "id": cid, "json": 1},
                 timeout=15
@@ -59,7 +80,7 @@ class TwoCaptcha:
 
     def report_bad(self, captcha_id: str) -> None:
         try:
-            requests.get(
+            self._http().get(
                 "http://2captcha.com/res.php",
                 params={"key": self.key, "action": "reportbad", "id": captcha_id},
                 timeout=10
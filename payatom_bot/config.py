@@ -1,12 +1,18 @@
 from __future__ import annotations
 import os
+import re
 import logging
-from dataclasses import dataclass, field
-from typing import Optional, List
+import functools
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple
 
 logger = logging.getLogger(__name__)
 
-@dataclass(frozen=False)
+# Resolved once at import rather than on every Settings construction
+_DEFAULT_PROFILE_ROOT = str(Path.home() / "chrome-profiles")
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     telegram_token: str
     telegram_chat_id: int
@@ -14,104 +20,131 @@ class Settings:
     two_captcha_key: str
     autobank_upload_url: str
     max_profiles: int = 10
-    profile_root: str = field(default_factory=lambda: os.path.join(os.path.expanduser("~"), "chrome-profiles"))
+    profile_root: str = _DEFAULT_PROFILE_ROOT
     
     # Balance alert settings
-    alert_group_ids: List[int] = field(default_factory=list)
+    alert_group_ids: Tuple[int, ...] = ()
     balance_check_interval: int = 180  # Check every 3 minutes (180 seconds)
 
-def load_settings() -> Settings:
-    """
-    Load application settings from environment variables.
-    
-    Raises:
-        RuntimeError: If required environment variables are missing or invalid
-    """
-    # Try to load from .env file (development convenience)
-    try:
-        from dotenv import load_dotenv  # type: ignore
-        load_dotenv()
-        logger.info("Loaded environment variables from .env file")
-    except ImportError:
-        logger.debug("python-dotenv not installed; skipping .env file")
-    except Exception as e:
-        logger.warning("Failed to load .env file: %s", e)
-
-    # Validate required token
-    token = os.environ.get("TELEGRAM_TOKEN")
-    if not token or not token.strip():
-        raise RuntimeError(
-            "❌ TELEGRAM_TOKEN is required in environment or .env file.\n"
-            "Please set it before starting the bot."
-        )
+    # Include full tracebacks in Telegram error replies (always logged)
+    debug: bool = False
 
-    # Validate and parse chat ID
-    chat_id_raw = os.environ.get("TELEGRAM_CHAT_ID", "")
-    if not chat_id_raw:
-        raise RuntimeError(
-            "❌ TELEGRAM_CHAT_ID is required in environment or .env file.\n"
-            "Please set it before starting the bot."
-        )
-    
+_GROUP_ID_RE = re.compile(r"-?\d+")
+
+def _parse_chat_id(raw: str) -> int:
     try:
-        chat_id = int(chat_id_raw)
+        return int(raw)
     except ValueError as e:
         raise RuntimeError(
-            f"❌ TELEGRAM_CHAT_ID must be a valid integer, got: {chat_id_raw!r}"
+            f"❌ TELEGRAM_CHAT_ID must be a valid integer, got: {raw!r}"
         ) from e
 
-    # Optional settings with defaults
-    two_captcha = os.environ.get("TWO_CAPTCHA_API_KEY", "")
-    if not two_captcha:
+def _parse_alert_group_ids(raw: str) -> Tuple[int, ...]:
+    # Pick out the integers directly; stray whitespace, newlines and extra
+    # commas are tolerated without a try/except
+    ids = tuple(map(int, _GROUP_ID_RE.findall(raw)))
+    if not ids:
         logger.warning(
-            "TWO_CAPTCHA_API_KEY not set; CAPTCHA solving will require manual input"
+            "Invalid ALERT_GROUP_IDS format (%r); balance alerts disabled. "
+            "Use comma-separated integers (e.g., '-1001234567890,-1009876543210')",
+            raw
         )
+        return ()
+    logger.info("Balance alerts will be sent to %d group(s)", len(ids))
+    return ids
 
-    autobank_url = os.environ.get(
-        "AUTOBANK_UPLOAD_URL",
-        "https://autobank.payatom.in/bankupload.php"
-    )
-    
-    creds_csv = os.environ.get("CREDENTIALS_CSV", "tmb_credentials.csv")
+def _parse_check_interval(raw: str) -> int:
+    try:
+        interval = int(raw)
+    except ValueError:
+        logger.warning("Invalid BALANCE_CHECK_INTERVAL; using default of 180 seconds")
+        return 180
+    if interval < 60:
+        logger.warning("BALANCE_CHECK_INTERVAL too low (%d); using minimum of 60 seconds", interval)
+        return 60
+    return interval
+
+def _parse_flag(raw: str) -> bool:
+    return raw.lower() in ("1", "true", "yes", "on")
+
+# Marks an environment variable that must be set
+_REQUIRED = object()
+
+# (env var, Settings field, parser, default, what to do when unset/blank).
+# The last column is _REQUIRED, None (stay silent) or a (level, message)
+# pair to log before falling back to the default.
+_ENV_SPEC = (
+    ("TELEGRAM_TOKEN", "telegram_token", str, None, _REQUIRED),
+    ("TELEGRAM_CHAT_ID", "telegram_chat_id", _parse_chat_id, None, _REQUIRED),
+    ("TWO_CAPTCHA_API_KEY", "two_captcha_key", str, "", (
+        logging.WARNING,
+        "TWO_CAPTCHA_API_KEY not set; CAPTCHA solving will require manual input",
+    )),
+    ("AUTOBANK_UPLOAD_URL", "autobank_upload_url", str,
+     "https://autobank.payatom.in/bankupload.php", None),
+    ("CREDENTIALS_CSV", "credentials_csv", str, "tmb_credentials.csv", None),
+    ("ALERT_GROUP_IDS", "alert_group_ids", _parse_alert_group_ids, (), (
+        logging.INFO,
+        "ALERT_GROUP_IDS not set; balance alerts disabled. "
+        "Set this variable to enable balance monitoring.",
+    )),
+    ("BALANCE_CHECK_INTERVAL", "balance_check_interval", _parse_check_interval, 180, None),
+    ("PAYATOM_DEBUG", "debug", _parse_flag, False, None),
+)
+
+def _has_dotenv() -> bool:
+    """
+    True if load_dotenv() would find a .env: it searches upward from this
+    package (e.g. payatom_bot/.env), so check there as well as the CWD.
+    """
+    here = Path(__file__).resolve().parent
+    return any((d / ".env").is_file() for d in (Path.cwd(), here, *here.parents))
+
+@functools.lru_cache(maxsize=1)
+def load_settings() -> Settings:
+    """
+    Load application settings from environment variables.
+
+    The result is cached, so the environment is parsed and validated only
+    once per process; call ``load_settings.cache_clear()`` to force a reload.
     
+    Raises:
+        RuntimeError: If required environment variables are missing or invalid
+    """
+    # Try to load from .env file (development convenience); skip the
+    # dotenv import entirely when there is no .env to read
+    if os.environ.get("PAYATOM_USE_DOTENV") == "1" or _has_dotenv():
+        try:
+            from dotenv import load_dotenv  # type: ignore
+            load_dotenv()
+            logger.info("Loaded environment variables from .env file")
+        except ImportError:
+            logger.debug("python-dotenv not installed; skipping .env file")
+        except Exception as e:
+            logger.warning("Failed to load .env file: %s", e)
+
+    vals = {}
+    for env_name, field_name, parse, default, on_missing in _ENV_SPEC:
+        raw = os.environ.get(env_name, "").strip()
+        if raw:
+            vals[field_name] = parse(raw)
+            continue
+        if on_missing is _REQUIRED:
+            raise RuntimeError(
+                f"❌ {env_name} is required in environment or .env file.\n"
+                "Please set it before starting the bot."
+            )
+        if on_missing is not None:
+            logger.log(*on_missing)
+        vals[field_name] = default
+
     # Validate credentials file exists
-    if not os.path.exists(creds_csv):
+    if not os.path.exists(vals["credentials_csv"]):
         logger.warning(
             "Credentials CSV file not found at: %s\n"
             "Make sure to create it before running workers.",
-            creds_csv
-        )
-    
-    # Parse balance alert group IDs
-    alert_group_ids = []
-    alert_ids_str = os.environ.get("ALERT_GROUP_IDS", "")
-    if alert_ids_str:
-        try:
-            alert_group_ids = [int(x.strip()) for x in alert_ids_str.split(",") if x.strip()]
-            logger.info("Balance alerts will be sent to %d group(s)", len(alert_group_ids))
-        except ValueError as e:
-            logger.warning(
-                "Invalid ALERT_GROUP_IDS format (%s); balance alerts disabled. "
-                "Use comma-separated integers (e.g., '-1001234567890,-1009876543210')",
-                e
-            )
-    else:
-        logger.info(
-            "ALERT_GROUP_IDS not set; balance alerts disabled. "
-            "Set this variable to enable balance monitoring."
+            vals["credentials_csv"]
         )
-    
-    # Parse balance check interval
-    check_interval = 180  # Default: 3 minutes
-    interval_str = os.environ.get("BALANCE_CHECK_INTERVAL", "")
-    if interval_str:
-        try:
-            check_interval = int(interval_str)
-            if check_interval < 60:
-                logger.warning("BALANCE_CHECK_INTERVAL too low (%d); using minimum of 60 seconds", check_interval)
-                check_interval = 60
-        except ValueError:
-            logger.warning("Invalid BALANCE_CHECK_INTERVAL; using default of 180 seconds")
 
     logger.info(
         "Settings loaded successfully:\n"
@@ -121,20 +154,12 @@ def load_settings() -> Settings:
         "  - 2Captcha: %s\n"
         "  - Balance Alerts: %s\n"
         "  - Check Interval: %d seconds",
-        chat_id,
-        creds_csv,
-        autobank_url,
-        "configured" if two_captcha else "not configured",
-        "enabled" if alert_group_ids else "disabled",
-        check_interval
+        vals["telegram_chat_id"],
+        vals["credentials_csv"],
+        vals["autobank_upload_url"],
+        "configured" if vals["two_captcha_key"] else "not configured",
+        "enabled" if vals["alert_group_ids"] else "disabled",
+        vals["balance_check_interval"]
     )
 
-    return Settings(
-        telegram_token=token,
-        telegram_chat_id=chat_id,
-        credentials_csv=creds_csv,
-        two_captcha_key=two_captcha,
-        autobank_upload_url=autobank_url,
-        alert_group_ids=alert_group_ids,
-        balance_check_interval=check_interval,
-    )
+    return Settings(**vals)
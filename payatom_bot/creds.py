@@ -1,10 +1,20 @@
 from __future__ import annotations
 import csv
+import functools
 import logging
-from typing import Dict, Optional
+import sys
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Column order used when unpacking each CSV row
+_COLUMNS = ("alias", "login_id", "user_id", "username", "password", "account_number")
+
+# Only this many skipped-row reasons are formatted and logged
+_MAX_SKIP_REASONS = 5
+
 # Map alias suffixes to the exact AutoBank dropdown labels.
 # Adjust strings to match your portal's options precisely.
 BANK_LABEL_BY_SUFFIX: Dict[str, str] = {
@@ -18,6 +28,38 @@ BANK_LABEL_BY_SUFFIX: Dict[str, str] = {
     "_cnrb":    "CANARA",
 }
 
+@dataclass(frozen=True, slots=True)
+class Credential:
+    """
+    One validated credentials row.
+
+    Supports ``cred["field"]`` and ``cred.get("field", default)`` so
+    workers written against the old per-row dicts keep working.
+    """
+    alias: str
+    auth_id: str
+    password: str
+    account_number: str
+    bank_label: str
+    # Raw fields kept in case a specific bank needs them
+    login_id: str = ""
+    user_id: str = ""
+    username: str = ""
+
+    def __getitem__(self, key: str) -> str:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key)
+
+# Longest suffix first so "_iobcorp" is always tested before "_iob"
+_SUFFIXES = tuple(sorted(BANK_LABEL_BY_SUFFIX.items(), key=lambda kv: -len(kv[0])))
+
+@functools.lru_cache(maxsize=128)
 def infer_bank_label_from_alias(alias: str) -> str:
     """
     Infer the bank label from alias suffix.
@@ -29,7 +71,7 @@ def infer_bank_label_from_alias(alias: str) -> str:
         Bank label string (e.g., "TMB", "IOB Corporate")
     """
     a = alias.lower().strip()
-    for suffix, label in BANK_LABEL_BY_SUFFIX.items():
+    for suffix, label in _SUFFIXES:
         if a.endswith(suffix):
             return label
     # Fallback: take last token after '_' and uppercase (e.g., foo_xyz -> XYZ)
@@ -49,152 +91,109 @@ def canonical_auth_id(username: str, login_id: str, user_id: str) -> Optional[st
     Returns:
         The first non-empty authentication identifier, or None
     """
-    for v in (username or "", login_id or "", user_id or ""):
-        v = v.strip()
-        if v:
-            return v
-    return None
+    candidates = (username or "", login_id or "", user_id or "")
+    return next((v for v in map(str.strip, candidates) if v), None)
+
+class _SkippedRows:
+    """Counts rejected CSV rows, formatting only the first few reasons."""
+    __slots__ = ("count", "reasons")
 
-def load_creds(csv_path: str) -> Dict[str, dict]:
+    def __init__(self) -> None:
+        self.count = 0
+        self.reasons: deque[str] = deque(maxlen=_MAX_SKIP_REASONS)
+
+    def add(self, line_num: int, alias: str, reason: str) -> None:
+        self.count += 1
+        if len(self.reasons) < _MAX_SKIP_REASONS:
+            if alias:
+                self.reasons.append(f"Line {line_num} (alias: {alias}): {reason}")
+            else:
+                self.reasons.append(f"Line {line_num}: {reason}")
+
+def _iter_rows(csv_path: str, skipped: _SkippedRows) -> Iterator[Tuple[int, Credential]]:
     """
-    Load credentials from CSV file with validation and error handling.
-    
-    CSV schema:
-      alias,login_id,user_id,username,password,account_number
-      
-    Returns:
-        Dictionary mapping alias to credential dict:
-        {
-            alias: {
-                auth_id, password, account_number, bank_label,
-                raw: {login_id, user_id, username}
-            }
-        }
-        
+    Parse the credentials CSV lazily, yielding ``(line_num, Credential)``
+    for each valid row and recording rejected rows in *skipped*.
+
     Raises:
         FileNotFoundError: If CSV file doesn't exist
         ValueError: If CSV is malformed or missing required columns
         PermissionError: If CSV file cannot be read
     """
-    logger.info("Loading credentials from: %s", csv_path)
-    
     try:
+        # Stream rows from the buffered file rather than decoding it all up front
         with open(csv_path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            
+            reader = csv.reader(f)
+            header = next(reader, None)
+        
             # Validate headers
-            if not reader.fieldnames:
+            if not header:
                 raise ValueError(
                     f"❌ CSV file '{csv_path}' appears to be empty or malformed.\n"
                     "Expected columns: alias, login_id, user_id, username, password, account_number"
                 )
-            
-            required = {"alias", "login_id", "user_id", "username", "password", "account_number"}
-            headers_lower = {h.lower() for h in reader.fieldnames}
-            missing = required - headers_lower
-            
+        
+            required = set(_COLUMNS)
+            idx = {h.lower(): i for i, h in enumerate(header)}
+            missing = required - idx.keys()
+        
             if missing:
                 raise ValueError(
                     f"❌ CSV file '{csv_path}' is missing required columns: {', '.join(sorted(missing))}\n"
                     f"Expected columns: {', '.join(sorted(required))}\n"
-                    f"Found columns: {', '.join(reader.fieldnames)}"
+                    f"Found columns: {', '.join(header)}"
                 )
 
-            out: Dict[str, dict] = {}
             line_num = 1  # header is line 1
-            skipped_count = 0
-            skipped_reasons: list[str] = []
-            
+
+            # Resolve column positions once instead of building a dict per row
+            ids = tuple(idx[c] for c in _COLUMNS)
+            _strip = str.strip
+        
             for row in reader:
+                if not row:
+                    continue  # blank line (DictReader skipped these too)
                 line_num += 1
-                alias = (row.get("alias") or "").strip()
-                
+                n = len(row)
+                alias, login_id, user_id, username, password, account_number = (
+                    _strip(row[i]) if i < n else "" for i in ids
+                )
+            
                 if not alias:
-                    skipped_count += 1
-                    skipped_reasons.append(f"Line {line_num}: Empty alias")
+                    skipped.add(line_num, "", "Empty alias")
                     continue
 
-                login_id = row.get("login_id") or ""
-                user_id = row.get("user_id") or ""
-                username = row.get("username") or ""
-                password = (row.get("password") or "").strip()
-                account_number = (row.get("account_number") or "").strip()
-
                 auth_id = canonical_auth_id(username, login_id, user_id)
-                
+            
                 # Validate required fields
                 if not auth_id:
-                    skipped_count += 1
-                    skipped_reasons.append(
-                        f"Line {line_num} (alias: {alias}): Missing username/login_id/user_id"
-                    )
+                    skipped.add(line_num, alias, "Missing username/login_id/user_id")
                     continue
-                    
+                
                 if not password:
-                    skipped_count += 1
-                    skipped_reasons.append(
-                        f"Line {line_num} (alias: {alias}): Missing password"
-                    )
+                    skipped.add(line_num, alias, "Missing password")
                     continue
-                    
+                
                 if not account_number:
-                    skipped_count += 1
-                    skipped_reasons.append(
-                        f"Line {line_num} (alias: {alias}): Missing account_number"
-                    )
+                    skipped.add(line_num, alias, "Missing account_number")
                     continue
 
-                # Check for duplicate aliases
-                if alias in out:
-                    logger.warning(
-                        "Duplicate alias '%s' at line %d; overwriting previous entry",
-                        alias,
-                        line_num
-                    )
-
-                bank_label = infer_bank_label_from_alias(alias)
-
-                out[alias] = {
-                    "alias": alias,
-                    "auth_id": auth_id,
-                    "password": password,
-                    "account_number": account_number,
-                    "bank_label": bank_label,
-                    # Keep raw fields in case a specific bank needs them:
-                    "login_id": login_id.strip(),
-                    "user_id": user_id.strip(),
-                    "username": username.strip(),
-                }
-                
-            # Log summary
-            logger.info(
-                "Loaded %d valid credential(s) from %s",
-                len(out),
-                csv_path
-            )
-            
-            if skipped_count > 0:
-                logger.warning(
-                    "Skipped %d incomplete row(s) from %s",
-                    skipped_count,
-                    csv_path
-                )
-                for reason in skipped_reasons[:5]:  # Show first 5 reasons
-                    logger.warning("  - %s", reason)
-                if len(skipped_reasons) > 5:
-                    logger.warning(
-                        "  ... and %d more skipped rows",
-                        len(skipped_reasons) - 5
-                    )
-            
-            if not out:
-                raise ValueError(
-                    f"❌ No valid credentials found in '{csv_path}'.\n"
-                    "Please ensure the file contains valid rows with all required fields."
+                # Intern the alias (reused as a key across registries) and the
+                # bank label (repeated across rows) so copies share one object
+                alias = sys.intern(alias)
+                bank_label = sys.intern(infer_bank_label_from_alias(alias))
+
+                yield line_num, Credential(
+                    alias=alias,
+                    auth_id=auth_id,
+                    password=password,
+                    account_number=account_number,
+                    bank_label=bank_label,
+                    login_id=login_id,
+                    user_id=user_id,
+                    username=username,
                 )
-                
-            return out
-            
+        
     except FileNotFoundError as e:
         logger.error("Credentials file not found: %s", csv_path)
         raise FileNotFoundError(
@@ -216,3 +215,68 @@ def load_creds(csv_path: str) -> Dict[str, dict]:
             f"Error: {e}\n"
             "Please check the file format."
         ) from e
+
+def load_creds(csv_path: str) -> Dict[str, Credential]:
+    """
+    Load credentials from CSV file with validation and error handling.
+    
+    CSV schema:
+      alias,login_id,user_id,username,password,account_number
+      
+    Returns:
+        Dictionary mapping alias to its Credential record:
+        {
+            alias: Credential(
+                alias, auth_id, password, account_number, bank_label,
+                login_id, user_id, username
+            )
+        }
+        
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        ValueError: If CSV is malformed or missing required columns
+        PermissionError: If CSV file cannot be read
+    """
+    logger.info("Loading credentials from: %s", csv_path)
+
+    out: Dict[str, Credential] = {}
+    skipped = _SkippedRows()
+
+    for line_num, cred in _iter_rows(csv_path, skipped):
+        # Check for duplicate aliases
+        if cred.alias in out:
+            logger.warning(
+                "Duplicate alias '%s' at line %d; overwriting previous entry",
+                cred.alias,
+                line_num
+            )
+        out[cred.alias] = cred
+        
+    # Log summary
+    logger.info(
+        "Loaded %d valid credential(s) from %s",
+        len(out),
+        csv_path
+    )
+    
+    if skipped.count > 0:
+        logger.warning(
+            "Skipped %d incomplete row(s) from %s",
+            skipped.count,
+            csv_path
+        )
+        for reason in skipped.reasons:  # Only the first few were kept
+            logger.warning("  - %s", reason)
+        if skipped.count > len(skipped.reasons):
+            logger.warning(
+                "  ... and %d more skipped rows",
+                skipped.count - len(skipped.reasons)
+            )
+    
+    if not out:
+        raise ValueError(
+            f"❌ No valid credentials found in '{csv_path}'.\n"
+            "Please ensure the file contains valid rows with all required fields."
+        )
+        
+    return out
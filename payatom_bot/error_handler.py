@@ -7,9 +7,11 @@ proper logging, Telegram notifications, and user-friendly formatting.
 """
 from __future__ import annotations
 
-import functools
-import html
+import inspect
 import logging
+import re
+import threading
+import time
 import traceback
 from typing import Callable, Optional, Any, TYPE_CHECKING
 
@@ -26,6 +28,76 @@ logger = logging.getLogger(__name__)
 SUPPORT_CONTACT = "@pablo_escobar999"
 SUPPORT_EMAIL = "support@moshano.in"
 
+# Identical errors (same type, message and context) reported again within
+# this many seconds are logged but not re-sent to Telegram
+ERROR_DEDUP_TTL = 30.0
+
+# (type name, message prefix, context) -> [last sent at, suppressed since]
+_recent_errors: dict[tuple[str, str, str], list] = {}
+_recent_errors_lock = threading.Lock()
+
+
+def _is_duplicate_error(error: BaseException, context: str) -> bool:
+    """
+    Return True if an identical error was notified less than
+    ERROR_DEDUP_TTL seconds ago; otherwise record this one as sent.
+    """
+    key = (type(error).__name__, str(error)[:200], context)
+    now = time.monotonic()
+    with _recent_errors_lock:
+        entry = _recent_errors.get(key)
+        if entry is not None and now - entry[0] < ERROR_DEDUP_TTL:
+            entry[1] += 1
+            return True
+
+        if entry is not None and entry[1]:
+            logger.info(
+                "Suppressed %d duplicate notification(s) for %s in %s",
+                entry[1],
+                key[0],
+                context,
+            )
+        _recent_errors[key] = [now, 0]
+
+        # Keep the table small during long error storms
+        if len(_recent_errors) > 256:
+            for k in [k for k, v in _recent_errors.items() if now - v[0] >= ERROR_DEDUP_TTL]:
+                del _recent_errors[k]
+    return False
+
+
+# Same replacements as html.escape(quote=True), applied in a single pass
+_HTML_TRANS = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+_NEEDS_ESCAPE_RE = re.compile(r"[&<>\"']")
+
+
+def _esc(text: str) -> str:
+    # Most contexts and type names have nothing to escape; a single search
+    # is cheaper than translate() building a new string
+    if _NEEDS_ESCAPE_RE.search(text) is None:
+        return text
+    return text.translate(_HTML_TRANS)
+
+
+# HTML-safe forms of the support details, for Telegram HTML messages
+SUPPORT_CONTACT_HTML = _esc(SUPPORT_CONTACT)
+SUPPORT_EMAIL_HTML = _esc(SUPPORT_EMAIL)
+
+# Static part of every formatted error message, built once at import
+_HEADER = (
+    "🚨 <b>Oops! An Unexpected Error Occurred</b>\n\n"
+    "An unhandled exception has occurred in the system. "
+    "If this issue persists, please contact our support team:\n"
+    f"• Telegram: {SUPPORT_CONTACT_HTML}\n"
+    f"• Email: {SUPPORT_EMAIL_HTML}\n\n"
+)
+
 
 def format_exception_message(
     error: BaseException,
@@ -46,42 +118,85 @@ def format_exception_message(
     Returns:
         Formatted HTML message ready for Telegram
     """
-    # Header with emoji and friendly message
-    header = (
-        "🚨 <b>Oops! An Unexpected Error Occurred</b>\n\n"
-        "An unhandled exception has occurred in the system. "
-        "If this issue persists, please contact our support team:\n"
-        f"• Telegram: {html.escape(SUPPORT_CONTACT)}\n"
-        f"• Email: {html.escape(SUPPORT_EMAIL)}\n\n"
-    )
-
-    # Context and error type
-    error_info = (
-        f"<b>📍 Context:</b> <code>{html.escape(context)}</code>\n"
-        f"<b>⚠️ Error Type:</b> <code>{html.escape(type(error).__name__)}</code>\n"
-        f"<b>💬 Message:</b> <code>{html.escape(str(error))}</code>\n"
-    )
+    # Header with emoji and friendly message, then context and error type
+    parts: list[str] = [
+        _HEADER,
+        f"<b>📍 Context:</b> <code>{_esc(context)}</code>\n",
+        f"<b>⚠️ Error Type:</b> <code>{_esc(type(error).__name__)}</code>\n",
+        f"<b>💬 Message:</b> <code>{_esc(str(error))}</code>\n",
+    ]
 
     # Traceback if requested
-    tb_section = ""
     if include_traceback:
-        tb_lines = traceback.format_exception(type(error), error, error.__traceback__)
-        tb_text = "".join(tb_lines)
-
-        # Limit traceback length
-        tb_split = tb_text.split("\n")
-        if len(tb_split) > max_tb_lines:
-            tb_displayed = "\n".join(tb_split[:max_tb_lines])
-            tb_displayed += f"\n... ({len(tb_split) - max_tb_lines} more lines)"
-        else:
-            tb_displayed = tb_text
+        _append_traceback_section(parts, _traceback_chunks(error), max_tb_lines)
 
-        tb_section = (
-            f"\n<b>🔍 Technical Details:</b>\n"
-            f"<pre>{html.escape(tb_displayed)}</pre>"
-        )
+    return "".join(parts)
 
-    return header + error_info + tb_section
+
+def _traceback_chunks(error: BaseException) -> list[str]:
+    """
+    Return ``traceback.format_exception`` output for *error*, cached on the
+    exception.
+
+    Formatting walks every frame and reads source lines via linecache, and
+    the same exception is often reported by more than one layer. The cache
+    is keyed on the traceback object so a re-raised error is reformatted.
+    """
+    tb = error.__traceback__
+    cached = getattr(error, "_cached_tb_chunks", None)
+    if cached is not None and cached[0] is tb:
+        return cached[1]
+
+    chunks = traceback.format_exception(type(error), error, tb)
+    try:
+        error._cached_tb_chunks = (tb, chunks)  # type: ignore[attr-defined]
+    except AttributeError:
+        pass
+    return chunks
+
+
+def _append_traceback_section(parts: list[str], tb_chunks: list[str], max_tb_lines: int) -> None:
+    """Append the escaped, length-limited traceback block to *parts*."""
+    parts.append("\n<b>🔍 Technical Details:</b>\n<pre>")
+
+    # Limit traceback length. Each chunk may span several lines; stop at the
+    # chunk holding the cut-off so the dropped tail is never joined or escaped
+    seen = 0  # newlines in the chunks kept so far
+    for i, chunk in enumerate(tb_chunks):
+        n = chunk.count("\n")
+        if seen + n < max_tb_lines:
+            seen += n
+            continue
+
+        end = -1
+        for _ in range(max_tb_lines - seen):
+            end = chunk.find("\n", end + 1)
+        kept = "".join(tb_chunks[:i]) + (chunk[:end] if end != -1 else "")
+        remaining = (
+            chunk.count("\n", end + 1)
+            + sum(c.count("\n") for c in tb_chunks[i + 1:])
+            + 1
+        )
+        parts.append(_esc(kept))
+        parts.append(f"\n... ({remaining} more lines)")
+        break
+    else:
+        parts.append(_esc("".join(tb_chunks)))
+
+    parts.append("</pre>")
+
+
+def _plain_error_summary(error: BaseException, context: str) -> str:
+    """Short plain-text error notice for sends without a parse mode."""
+    return (
+        "🚨 Oops! An Unexpected Error Occurred\n\n"
+        f"Context: {context}\n"
+        f"Error Type: {type(error).__name__}\n"
+        f"Message: {error}\n\n"
+        "If this issue persists, please contact our support team:\n"
+        f"• Telegram: {SUPPORT_CONTACT}\n"
+        f"• Email: {SUPPORT_EMAIL}"
+    )
 
 
 async def notify_error_to_telegram(
@@ -102,49 +217,58 @@ async def notify_error_to_telegram(
         context: Description of where/what was happening
         include_traceback: Whether to include the full traceback
     """
+    if _is_duplicate_error(error, context):
+        return
+
+    # Format the summary once; the traceback is only walked when requested
     message = format_exception_message(
         error,
         context,
-        include_traceback=include_traceback,
+        include_traceback=False,
     )
+    tb_chunks = _traceback_chunks(error) if include_traceback else []
 
     try:
+        if include_traceback:
+            tb_parts: list[str] = [message]
+            _append_traceback_section(tb_parts, tb_chunks, max_tb_lines=15)
+            full_message = "".join(tb_parts)
+        else:
+            full_message = message
+
         # Split message if too long (Telegram limit is ~4096 characters)
-        if len(message) > 4000:
-            # Send header and error info first
-            header_msg = format_exception_message(
-                error,
-                context,
-                include_traceback=False,
-            )
+        if len(full_message) > 4000:
+            # Send header/error info and the traceback as two messages.
+            # Only the first 3800 characters fit; stop joining once reached
+            head: list[str] = []
+            size = 0
+            for chunk in tb_chunks or _traceback_chunks(error):
+                head.append(chunk)
+                size += len(chunk)
+                if size >= 3800:
+                    break
+            tb_text = "".join(head)
+            # Sent one after the other so the header always arrives first
             await bot.send_message(
                 chat_id=chat_id,
-                text=header_msg,
+                text=message,
                 parse_mode=ParseMode.HTML,
                 disable_web_page_preview=True,
             )
-
-            # Then send traceback separately
-            tb_text = "".join(
-                traceback.format_exception(type(error), error, error.__traceback__)
-            )
             await bot.send_message(
                 chat_id=chat_id,
-                text=f"<b>🔍 Full Traceback:</b>\n<pre>{html.escape(tb_text[:3800])}</pre>",
+                text=f"<b>🔍 Full Traceback:</b>\n<pre>{_esc(tb_text[:3800])}</pre>",
                 parse_mode=ParseMode.HTML,
             )
         else:
             await bot.send_message(
                 chat_id=chat_id,
-                text=message,
+                text=full_message,
                 parse_mode=ParseMode.HTML,
                 disable_web_page_preview=True,
             )
-    except Exception as notify_error:
-        logger.exception(
-            "Failed to send error notification to Telegram: %s",
-            notify_error,
-        )
+    except Exception:
+        logger.exception("Failed to send error notification to Telegram")
 
 
 async def handle_handler_exception(
@@ -163,12 +287,12 @@ async def handle_handler_exception(
         handler_name: Name of the handler for logging
     """
     logger.exception(
-        "Exception in handler '%s': %s",
+        "Exception in handler '%s'",
         handler_name,
-        error,
     )
 
     message = format_exception_message(error, handler_name)
+    parse_mode: Optional[str] = ParseMode.HTML
 
     # Try to reply to the message that caused the error
     try:
@@ -179,8 +303,12 @@ async def handle_handler_exception(
                 disable_web_page_preview=True,
             )
             return
-    except Exception as reply_error:
-        logger.exception("Failed to reply to message: %s", reply_error)
+    except Exception:
+        logger.exception("Failed to reply to message")
+        # Retry with a tag-free summary so a rejected HTML payload cannot
+        # make the fallback fail the same way
+        message = _plain_error_summary(error, handler_name)
+        parse_mode = None
 
     # Fallback: send to the chat
     try:
@@ -188,11 +316,21 @@ async def handle_handler_exception(
             await context.bot.send_message(
                 chat_id=update.effective_chat.id,
                 text=message,
-                parse_mode=ParseMode.HTML,
+                parse_mode=parse_mode,
                 disable_web_page_preview=True,
             )
-    except Exception as send_error:
-        logger.exception("Failed to send error message to chat: %s", send_error)
+    except Exception:
+        logger.exception("Failed to send error message to chat")
+
+
+def _wrap(wrapper: Callable, func: Callable) -> Callable:
+    """Copy the identifying attributes functools.wraps would, minus __dict__."""
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func  # type: ignore[attr-defined]
+    return wrapper
 
 
 def telegram_handler_error_wrapper(handler_func: Callable) -> Callable:
@@ -205,7 +343,6 @@ def telegram_handler_error_wrapper(handler_func: Callable) -> Callable:
             # handler code
     """
 
-    @functools.wraps(handler_func)
     async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
         try:
             return await handler_func(update, context, *args, **kwargs)
@@ -217,7 +354,40 @@ def telegram_handler_error_wrapper(handler_func: Callable) -> Callable:
                 handler_func.__name__,
             )
 
-    return wrapper
+    return _wrap(wrapper, handler_func)
+
+
+def _report_worker_error(worker: Any, method: Callable, e: Exception) -> None:
+    """Log, notify and screenshot after a wrapped worker method raised."""
+    # Get method context
+    context = f"{worker.__class__.__name__}.{method.__name__} [{worker.alias}]"
+
+    # Log the error
+    logger.exception(
+        "Exception in %s",
+        context,
+    )
+
+    # Format and send error message via worker's messenger
+    msgr = getattr(worker, "msgr", None)
+    if (
+        msgr is not None
+        and msgr.should_send()
+        and not _is_duplicate_error(e, context)
+    ):
+        message = format_exception_message(e, context)
+        try:
+            msgr.send_event(message, kind="ERROR")
+        except Exception:
+            logger.exception("Failed to send error via messenger")
+
+    # Take screenshot if possible
+    screenshot_all_tabs = getattr(worker, "screenshot_all_tabs", None)
+    if screenshot_all_tabs is not None:
+        try:
+            screenshot_all_tabs(f"Error in {method.__name__}")
+        except Exception:
+            logger.exception("Failed to take error screenshot")
 
 
 def worker_method_error_wrapper(method: Callable) -> Callable:
@@ -230,47 +400,33 @@ def worker_method_error_wrapper(method: Callable) -> Callable:
             def _some_method(self):
                 # method code
     """
+    params = list(inspect.signature(method).parameters.values())
+
+    # Most worker steps take only ``self``; give those a wrapper without the
+    # *args/**kwargs packing that the generic form pays on every call
+    if len(params) == 1 and params[0].kind in (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    ):
+        def wrapper(self):
+            try:
+                return method(self)
+            except Exception as e:
+                _report_worker_error(self, method, e)
+                # Re-raise to allow caller to handle
+                raise
+
+        return _wrap(wrapper, method)
 
-    @functools.wraps(method)
     def wrapper(self, *args, **kwargs):
         try:
             return method(self, *args, **kwargs)
         except Exception as e:
-            # Get method context
-            context = f"{self.__class__.__name__}.{method.__name__} [{self.alias}]"
-
-            # Log the error
-            logger.exception(
-                "Exception in %s: %s",
-                context,
-                e,
-            )
-
-            # Format and send error message via worker's messenger
-            if hasattr(self, "msgr") and hasattr(self, "alias"):
-                message = format_exception_message(e, context)
-                try:
-                    self.msgr.send_event(message, kind="ERROR")
-                except Exception as msg_error:
-                    logger.exception(
-                        "Failed to send error via messenger: %s",
-                        msg_error,
-                    )
-
-            # Take screenshot if possible
-            if hasattr(self, "screenshot_all_tabs"):
-                try:
-                    self.screenshot_all_tabs(f"Error in {method.__name__}")
-                except Exception as screenshot_error:
-                    logger.exception(
-                        "Failed to take error screenshot: %s",
-                        screenshot_error,
-                    )
-
+            _report_worker_error(self, method, e)
             # Re-raise to allow caller to handle
             raise
 
-    return wrapper
+    return _wrap(wrapper, method)
 
 
 class ErrorContext:
@@ -309,24 +465,28 @@ class ErrorContext:
 
         # Log the error
         logger.exception(
-            "Exception in %s: %s",
+            "Exception in %s",
             full_context,
-            exc_val,
         )
 
-        # Send via messenger if available
-        if self.messenger:
+        # Send via messenger if available; skip formatting if it would drop it
+        if self.messenger and self.messenger.should_send():
             message = format_exception_message(exc_val, full_context)
             try:
                 self.messenger.send_event(message, kind="ERROR")
-            except Exception as msg_error:
-                logger.exception(
-                    "Failed to send error via messenger: %s",
-                    msg_error,
-                )
+            except Exception:
+                logger.exception("Failed to send error via messenger")
+
+        if not self.reraise:
+            # The exception is swallowed here, so nothing needs its frames;
+            # drop the traceback (and any cached text) rather than leaving
+            # the frame tree alive for as long as the object is referenced
+            exc_val.__traceback__ = None
+            exc_val.__dict__.pop("_cached_tb_chunks", None)
+            return True
 
-        # Return True to suppress exception, False to propagate
-        return not self.reraise
+        # Propagate the exception unchanged
+        return False
 
 
 def safe_operation(
@@ -353,12 +513,11 @@ def safe_operation(
     """
     try:
         return operation(*args, **kwargs)
-    except Exception as e:
+    except Exception:
         if log_errors:
             logger.exception(
-                "Safe operation '%s' failed: %s",
+                "Safe operation '%s' failed",
                 context,
-                e,
             )
         return default
 
@@ -387,11 +546,10 @@ async def safe_async_operation(
     """
     try:
         return await operation(*args, **kwargs)
-    except Exception as e:
+    except Exception:
         if log_errors:
             logger.exception(
-                "Safe async operation '%s' failed: %s",
+                "Safe async operation '%s' failed",
                 context,
-                e,
             )
         return default
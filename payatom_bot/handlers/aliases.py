@@ -3,10 +3,17 @@ from __future__ import annotations
 import asyncio
 import csv
 import html
+import io
+import itertools
 import logging
 import os
+import re
+import threading
+import time
 import traceback
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.constants import ParseMode
@@ -20,12 +27,55 @@ from telegram.ext import (
 )
 
 from ..config import Settings
-from ..creds import load_creds
+from ..creds import Credential, load_creds
 
 logger = logging.getLogger(__name__)
 
-# chat_id -> {"alias": ..., "field": ..., "label": ...}
-pending_edit: Dict[int, Dict[str, str]] = {}
+class _PendingEdits:
+    """
+    chat_id -> {"alias": ..., "field": ..., "label": ...} for /edit flows
+    waiting on a new value. Bounded (oldest dropped first) and entries expire
+    after `ttl` seconds, so abandoned flows don't pile up.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 300.0) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._items: "OrderedDict[int, Tuple[float, Dict[str, str]]]" = OrderedDict()
+
+    def __setitem__(self, chat_id: int, state: Dict[str, str]) -> None:
+        self._items[chat_id] = (time.monotonic(), state)
+        self._items.move_to_end(chat_id)
+        while len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
+
+    def get(self, chat_id: int) -> Optional[Dict[str, str]]:
+        entry = self._items.get(chat_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.ttl:
+            del self._items[chat_id]
+            return None
+        return entry[1]
+
+    def pop(self, chat_id: int, default: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+        entry = self._items.pop(chat_id, None)
+        return default if entry is None else entry[1]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+pending_edit = _PendingEdits()
+
+# Column order of the credentials CSV written by /add
+FIELDNAMES = ("alias", "login_id", "user_id", "username", "password", "account_number")
+
+# Strips everything but digits when masking account numbers for /list
+_NON_DIGITS_RE = re.compile(r"\D")
+
+# One /list line: index, escaped alias, escaped masked account
+_LIST_ROW_TEMPLATE = "%02d. <b>%s</b>  |  <code>%s</code>"
 
 # Map short keys from the inline keyboard to CSV fields + human labels
 FIELDS_MAP: Dict[str, tuple[str, str]] = {
@@ -54,7 +104,7 @@ def _get_settings(app: Application) -> Settings:
     return settings
 
 
-def _get_creds(app: Application) -> Dict[str, dict]:
+def _get_creds(app: Application) -> Dict[str, Credential]:
     """
     Return the in-memory credentials mapping.
 
@@ -68,8 +118,62 @@ def _get_creds(app: Application) -> Dict[str, dict]:
     return {}
 
 
-def _set_creds(app: Application, creds: Dict[str, dict]) -> None:
+def _set_creds(app: Application, creds: Dict[str, Credential]) -> None:
     app.bot_data["creds_by_alias"] = creds
+    app.bot_data["creds_by_account"] = _index_by_account(creds)
+    app.bot_data["creds_display"] = _display_rows(creds)
+
+
+def _index_by_account(creds: Dict[str, Credential]) -> Dict[str, str]:
+    return {
+        acc: alias
+        for alias, c in creds.items()
+        if (acc := (c.get("account_number") or "").strip())
+    }
+
+
+def _iter_display_rows(creds: Dict[str, Credential]) -> Iterator[Tuple[str, str, str]]:
+    """Yield (bank_label, alias, masked_account) for each credential."""
+    for alias, cred in creds.items():
+        bank = (cred.get("bank_label") or "").strip() or "UNKNOWN"
+        acc = str(cred.get("account_number", "") or "")
+        digits = _NON_DIGITS_RE.sub("", acc)
+        last4 = digits[-4:] if digits else (acc[-4:] if acc else "")
+        yield bank, alias, f"***{last4}" if last4 else "***"
+
+
+def _display_rows(creds: Dict[str, Credential]) -> List[Tuple[str, str, str]]:
+    """
+    /list rows as (bank_label, alias, masked_account), sorted by bank then
+    alias (case-insensitive) and already HTML-escaped.
+    """
+    esc = html.escape
+    return [
+        (esc(bank), esc(alias), esc(masked))
+        for bank, alias, masked in sorted(
+            _iter_display_rows(creds), key=lambda t: (t[0].lower(), t[1].lower())
+        )
+    ]
+
+
+def _get_creds_display(app: Application) -> List[Tuple[str, str, str]]:
+    display = app.bot_data.get("creds_display")
+    if not isinstance(display, list):
+        display = _display_rows(_get_creds(app))
+        app.bot_data["creds_display"] = display
+    return display
+
+
+def _get_creds_by_account(app: Application) -> Dict[str, str]:
+    """
+    account_number -> alias reverse index of the in-memory credentials,
+    kept in step by _set_creds and built on first use otherwise.
+    """
+    by_account = app.bot_data.get("creds_by_account")
+    if not isinstance(by_account, dict):
+        by_account = _index_by_account(_get_creds(app))
+        app.bot_data["creds_by_account"] = by_account
+    return by_account
 
 
 def _get_workers(app: Application) -> Dict[str, object]:
@@ -87,18 +191,20 @@ def _get_workers(app: Application) -> Dict[str, object]:
     return reg  # type: ignore[return-value]
 
 
-def _format_unhandled_exception(where: str, error: BaseException) -> str:
-    tb = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+def _format_unhandled_exception(
+    where: str, error: BaseException, include_tb: bool = True
+) -> str:
     header = (
         "<b>Oops! We have encountered an unhandled exception.</b>\n"
         "Please contact the administrator for more information.\n\n"
     )
     body = (
         f"<b>Location:</b> <code>{html.escape(where)}</code>\n"
-        f"<b>Error:</b> <code>{html.escape(str(error))}</code>\n\n"
-        "<b>Traceback:</b>\n"
-        f"<pre>{html.escape(tb)}</pre>"
+        f"<b>Error:</b> <code>{html.escape(str(error))}</code>"
     )
+    if include_tb:
+        tb = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+        body += f"\n\n<b>Traceback:</b>\n<pre>{html.escape(tb)}</pre>"
     return header + body
 
 
@@ -109,12 +215,16 @@ async def _notify_unhandled_exception(
     error: BaseException,
 ) -> None:
     """
-    Log an unhandled exception and send a detailed error + traceback
-    to Telegram in a consistent, professional format.
+    Log an unhandled exception and send a detailed error to Telegram in a
+    consistent, professional format. The traceback always goes to the log;
+    it is only included in the Telegram message when Settings.debug is set.
     """
     logger.exception("Unhandled exception in %s", where, exc_info=error)
 
-    text = _format_unhandled_exception(where, error)
+    settings = context.application.bot_data.get("settings")
+    text = _format_unhandled_exception(
+        where, error, include_tb=bool(getattr(settings, "debug", False))
+    )
 
     msg = update.effective_message
     if msg is not None:
@@ -142,37 +252,267 @@ async def _notify_unhandled_exception(
             logger.exception("Failed to send error message via bot.send_message")
 
 
+# Serializes CSV edits/appends now that they run on worker threads
+_csv_lock = threading.Lock()
+
+# Larger than the 8 KiB default so big credential files need fewer
+# read()/write() syscalls
+_CSV_BUFFER_SIZE = 1 << 20
+
+# alias -> (byte offset, byte length) of its line in the credentials CSV,
+# used to patch single-field edits in place. _row_index_key records the
+# (path, mtime_ns, size) the offsets belong to, so any other write to the
+# file (/add, a full rewrite, a manual edit) makes them stale.
+_row_offsets: Dict[str, Tuple[int, int]] = {}
+_row_columns: Dict[str, int] = {}
+_row_index_key: Optional[Tuple[str, int, int]] = None
+
+
+def _open_csv(path: str, mode: str = "r"):
+    """Open the credentials CSV with a 1 MiB buffer (default is 8 KiB)."""
+    return open(path, mode, buffering=_CSV_BUFFER_SIZE, newline="", encoding="utf-8")
+
+
+def _stat_key(csv_path: str) -> Tuple[str, int, int]:
+    st = os.stat(csv_path)
+    return (csv_path, st.st_mtime_ns, st.st_size)
+
+
+def _index_row_offsets(csv_path: str) -> bool:
+    """
+    Rebuild the alias -> line offset index for csv_path.
+
+    Returns False (leaving the index empty) when the file cannot be
+    indexed line by line, e.g. a quoted field spans several lines.
+    Aliases that appear on more than one line are left out, since an
+    edit has to touch all of them.
+    """
+    global _row_index_key
+    _row_offsets.clear()
+    _row_columns.clear()
+    _row_index_key = None
+
+    offsets: Dict[str, Tuple[int, int]] = {}
+    duplicates = set()
+    with open(csv_path, "rb") as f:
+        try:
+            header = next(csv.reader([f.readline().decode("utf-8")]), [])
+        except UnicodeDecodeError:
+            return False
+        columns = {name.strip(): i for i, name in enumerate(header)}
+        alias_idx = columns.get("alias")
+        if alias_idx is None:
+            return False
+
+        while True:
+            offset = f.tell()
+            line = f.readline()
+            if not line:
+                break
+            try:
+                text = line.decode("utf-8")
+            except UnicodeDecodeError:
+                return False
+            if text.count('"') % 2:
+                return False  # quoted newline: rows don't map to lines
+            row = next(csv.reader([text]), [])
+            alias = row[alias_idx].strip() if len(row) > alias_idx else ""
+            if not alias:
+                continue
+            if alias in offsets:
+                duplicates.add(alias)
+            offsets[alias] = (offset, len(line))
+        st = os.fstat(f.fileno())
+        key = (csv_path, st.st_mtime_ns, st.st_size)
+
+    for alias in duplicates:
+        del offsets[alias]
+    _row_offsets.update(offsets)
+    _row_columns.update(columns)
+    _row_index_key = key
+    return True
+
+
+def _account_owner(csv_path: str, account_number: str, alias: str) -> Optional[str]:
+    """Alias of another CSV row already using account_number, if any."""
+    with _open_csv(csv_path) as f:
+        rdr = csv.reader(f)
+        col = {name.strip(): i for i, name in enumerate(next(rdr, []))}
+        alias_idx = col.get("alias")
+        acc_idx = col.get("account_number")
+        if acc_idx is None:
+            return None
+        for row in rdr:
+            if len(row) <= acc_idx or row[acc_idx].strip() != account_number:
+                continue
+            other = row[alias_idx].strip() if alias_idx is not None and len(row) > alias_idx else ""
+            if other and other != alias:
+                return other
+    return None
+
+
+def _csv_field_value(csv_path: str, alias: str, field_key: str) -> Optional[str]:
+    """
+    Current value of field_key on alias's CSV row, or None when the row or
+    column is missing (or alias's rows disagree). The caller holds _csv_lock.
+    """
+    try:
+        if _row_index_key == _stat_key(csv_path) or _index_row_offsets(csv_path):
+            loc = _row_offsets.get(alias)
+            col = _row_columns.get(field_key)
+            if loc is not None and col is not None:
+                offset, length = loc
+                with open(csv_path, "rb") as f:
+                    f.seek(offset)
+                    row = next(csv.reader([f.read(length).decode("utf-8")]), [])
+                return row[col].strip() if len(row) > col else None
+    except (OSError, UnicodeDecodeError, csv.Error):
+        return None
+
+    # Not indexable (or alias is on several lines): scan the whole file
+    values = set()
+    try:
+        with _open_csv(csv_path) as f:
+            rdr = csv.reader(f)
+            col = {name.strip(): i for i, name in enumerate(next(rdr, []))}
+            alias_idx = col.get("alias")
+            field_idx = col.get(field_key)
+            if alias_idx is None or field_idx is None:
+                return None
+            for row in rdr:
+                if len(row) > alias_idx and row[alias_idx].strip() == alias:
+                    values.add(row[field_idx].strip() if len(row) > field_idx else "")
+    except (OSError, UnicodeDecodeError, csv.Error):
+        return None
+    return values.pop() if len(values) == 1 else None
+
+
+def _patch_row_in_place(csv_path: str, alias: str, field_key: str, new_value: str) -> bool:
+    """
+    Rewrite one field of alias's row in place when the re-serialized row
+    keeps its exact byte length. Returns False if the caller has to fall
+    back to rewriting the whole file.
+    """
+    global _row_index_key
+    try:
+        if _row_index_key != _stat_key(csv_path) and not _index_row_offsets(csv_path):
+            return False
+    except OSError:
+        return False
+
+    loc = _row_offsets.get(alias)
+    col = _row_columns.get(field_key)
+    if loc is None or col is None:
+        return False
+    offset, length = loc
+
+    # Binary seek/read/write rather than os.pread/pwrite, which Windows lacks
+    try:
+        with open(csv_path, "r+b") as f:
+            f.seek(offset)
+            old_line = f.read(length).decode("utf-8")
+            row = next(csv.reader([old_line]), [])
+            if len(row) <= col:
+                return False
+            row[col] = new_value
+
+            eol = "\r\n" if old_line.endswith("\r\n") else "\n" if old_line.endswith("\n") else ""
+            buf = io.StringIO()
+            csv.writer(buf, lineterminator=eol).writerow(row)
+            new_line = buf.getvalue().encode("utf-8")
+            if len(new_line) != length:
+                return False
+
+            f.seek(offset)
+            f.write(new_line)
+    except (OSError, UnicodeDecodeError):
+        logger.exception("In-place update of %s in %s failed; rewriting the file", alias, csv_path)
+        return False
+
+    _row_index_key = _stat_key(csv_path)
+    return True
+
+
 def update_credentials_csv(
     app: Application,
     alias: str,
     field_key: str,
     new_value: str,
-) -> None:
+) -> Optional[Dict[str, Credential]]:
     """
     Update one field in the CSV for a given alias.
     Enforces uniqueness if field is account_number.
-    Also hot-updates in-memory creds and any running worker.
+
+    Returns the reloaded credentials (None if the value was unchanged and
+    nothing was written). It does not touch bot_data or running workers:
+    the caller applies the result with _apply_creds on the event loop.
 
     Any low-level IO error is wrapped in a RuntimeError with a
     human-readable message so the caller can show it to the user.
+
+    Blocking (file IO); async callers run it via asyncio.to_thread.
     """
+    with _csv_lock:
+        return _update_credentials_csv_locked(app, alias, field_key, new_value)
+
+
+def _update_credentials_csv_locked(
+    app: Application,
+    alias: str,
+    field_key: str,
+    new_value: str,
+) -> Optional[Dict[str, Credential]]:
+    """Body of update_credentials_csv; the caller holds _csv_lock."""
+    global _row_index_key
     settings: Settings = _get_settings(app)
     csv_path = settings.credentials_csv
     new_value = (new_value or "").strip()
 
-    rows: List[dict] = []
+    # Nothing to write when the CSV row already holds this value
+    if _csv_field_value(csv_path, alias, field_key) == new_value:
+        return None
+
+    # Account numbers must be unique across every CSV row, including rows
+    # load_creds skipped, so check the file itself before either write path.
+    # A read error here falls through to the full path, which reports it.
+    if field_key == "account_number":
+        try:
+            other = _account_owner(csv_path, new_value, alias)
+        except (OSError, csv.Error):
+            other = None
+        if other:
+            raise ValueError(f"Account number already used by alias '{other}'")
+
+    # Fast path: same-length edits are patched in place
+    if _patch_row_in_place(csv_path, alias, field_key, new_value):
+        return _reload_creds(csv_path)
+
+    rows: List[List[str]] = []
+    header: List[str] = []
     found = False
     used_by: Optional[str] = None
-    fieldnames: Optional[List[str]] = None
 
     # read all rows, prepare updates
     try:
-        with open(csv_path, newline="", encoding="utf-8") as f:
-            rdr = csv.DictReader(f)
-            fieldnames = rdr.fieldnames
+        with _open_csv(csv_path) as f:
+            rdr = csv.reader(f)
+            header = next(rdr, [])
+            col = {name.strip(): i for i, name in enumerate(header)}
+            alias_idx = col.get("alias")
+            acc_idx = col.get("account_number")
+            field_idx = col.get(field_key)
+            if field_idx is None and alias_idx is not None:
+                header.append(field_key)
+                field_idx = len(header) - 1
+            width = len(header)
+
             for row in rdr:
-                alias_in_row = (row.get("alias") or "").strip()
-                acc_in_row = (row.get("account_number") or "").strip()
+                if not row:
+                    continue  # blank line
+                if len(row) < width:
+                    row += [""] * (width - len(row))
+                alias_in_row = row[alias_idx].strip() if alias_idx is not None else ""
+                acc_in_row = row[acc_idx].strip() if acc_idx is not None else ""
 
                 if (
                     field_key == "account_number"
@@ -182,7 +522,7 @@ def update_credentials_csv(
                     used_by = alias_in_row
 
                 if alias_in_row == alias:
-                    row[field_key] = new_value
+                    row[field_idx] = new_value
                     found = True
 
                 rows.append(row)
@@ -203,22 +543,42 @@ def update_credentials_csv(
         # Same error text as old main.py so previous tooling still matches.
         raise ValueError(f"Account number already used by alias '{used_by}'")
 
-    if fieldnames is None:
-        fieldnames = [
-            "alias",
-            "login_id",
-            "user_id",
-            "username",
-            "password",
-            "account_number",
-        ]
-
-    # write back
+    # write back; row offsets no longer hold once the file is rewritten
+    _row_index_key = None
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    w.writerow(header)
+    w.writerows(rows)
+    data = buf.getvalue().encode("utf-8")
+
+    # Write the whole file with one write() into a sibling temp file and
+    # swap it in, so the rewrite is a single submission and readers never
+    # see a half-written CSV
+    # (O_BINARY keeps Windows from turning csv's \r\n into \r\r\n)
+    tmp_path = f"{csv_path}.tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
     try:
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=fieldnames)
-            w.writeheader()
-            w.writerows(rows)
+        fd = os.open(tmp_path, flags, 0o600)
+        try:
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            try:
+                os.chmod(tmp_path, os.stat(csv_path).st_mode & 0o7777)
+            except OSError:
+                pass
+            os.replace(tmp_path, csv_path)
+        except BaseException:
+            # Don't leave a stray .tmp behind
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
     except PermissionError as e:
         logger.exception("No permission to write credentials CSV at %s", csv_path)
         raise RuntimeError(f"No permission to write credentials CSV at '{csv_path}'.") from e
@@ -226,29 +586,80 @@ def update_credentials_csv(
         logger.exception("OS error while writing credentials CSV at %s", csv_path)
         raise RuntimeError(f"Failed to write credentials CSV '{csv_path}': {e}") from e
 
-    # refresh in-memory creds
+    return _reload_creds(csv_path)
+
+
+def _reload_creds(csv_path: str) -> Dict[str, Credential]:
+    """Reload creds after an edit (blocking)."""
     try:
-        new_creds = load_creds(csv_path)
+        return load_creds(csv_path)
     except Exception as e:  # csv.Error etc.
         logger.exception("Failed to reload credentials from %s", csv_path)
         raise RuntimeError(f"Credentials file '{csv_path}' is corrupted or unreadable: {e}") from e
 
+
+def _apply_creds(app: Application, new_creds: Dict[str, Credential], alias: str) -> None:
+    """
+    Store reloaded creds and hand the new record to a running worker.
+    Call on the event loop, where the handlers read bot_data.
+    """
     _set_creds(app, new_creds)
 
     # live-update any running worker's cred snapshot (best-effort)
     workers = _get_workers(app)
     wkr = workers.get(alias)
-    if wkr is not None:
+    if wkr is not None and alias in new_creds:
         try:
-            # worker.cred is a dict snapshot; keep this best-effort
-            wkr.cred[field_key] = new_value  # type: ignore[attr-defined]
+            # Credential records are immutable; swap in the reloaded one so
+            # derived fields such as auth_id stay consistent
+            wkr.cred = new_creds[alias]  # type: ignore[attr-defined]
         except Exception:
             logger.debug(
-                "Worker for alias %s does not expose a 'cred' dict; skipping live update.",
+                "Worker for alias %s does not expose a 'cred' attribute; skipping live update.",
                 alias,
             )
 
 
+def _append_alias_row_blocking(csv_path: str, row: Tuple[str, ...]) -> Dict[str, Credential]:
+    """
+    Append one alias row to the credentials CSV (writing the header for a
+    new file) and return the reloaded credentials. Blocking; run it via
+    asyncio.to_thread.
+    """
+    with _csv_lock:
+        parent = os.path.dirname(csv_path)
+        if parent:
+            try:
+                os.makedirs(parent, exist_ok=True)
+            except OSError as e:
+                raise RuntimeError(
+                    f"Failed to prepare credentials file directory '{parent}': {e}"
+                ) from e
+
+        is_new = not os.path.exists(csv_path) or (os.path.getsize(csv_path) == 0)
+
+        try:
+            with _open_csv(csv_path, "a") as f:
+                writer = csv.writer(f)
+                if is_new:
+                    writer.writerow(FIELDNAMES)
+                writer.writerow(row)
+        except PermissionError as e:
+            raise RuntimeError(f"No permission to write credentials CSV: {e}") from e
+        except OSError as e:
+            raise RuntimeError(f"Failed to write credentials CSV: {e}") from e
+
+        # Reload creds into memory
+        try:
+            new_creds = load_creds(csv_path)
+        except Exception as e:
+            raise RuntimeError(
+                f"Alias added to file, but failed to reload credentials: {e}"
+            ) from e
+
+    return new_creds
+
+
 # ─────────────────────────────
 # /list and /aliases
 # ─────────────────────────────
@@ -270,50 +681,18 @@ async def list_aliases(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
             await update.message.reply_text("No credentials found in database.")
             return
 
-        # Build a list of (bank_label, alias, masked_account) for sorting / grouping.
-        items: List[tuple[str, str, str]] = []
-        for alias, cred in creds.items():
-            bank = (cred.get("bank_label") or "").strip() or "UNKNOWN"
-            acc = str(cred.get("account_number", "") or "")
-            digits = "".join(ch for ch in acc if ch.isdigit())
-            last4 = digits[-4:] if digits else (acc[-4:] if acc else "")
-            masked = f"***{last4}" if last4 else "***"
-            items.append((bank, alias, masked))
-
-        # Sort by bank name, then alias (case-insensitive).
-        items.sort(key=lambda t: (t[0].lower(), t[1].lower()))
-
-        # Group by bank and build text blocks.
-        messages: List[str] = []
-        current_bank: Optional[str] = None
-        current_lines: List[str] = []
-        idx = 1
-
-        def flush_block() -> None:
-            nonlocal current_bank, current_lines
-            if current_bank is None or not current_lines:
-                return
-            header = f"<b><u>{html.escape(current_bank)}</u></b>"
-            body = "\n".join(current_lines)
-            messages.append(f"{header}\n{body}")
-            current_bank = None
-            current_lines = []
-
-        for bank, alias, masked in items:
-            if bank != current_bank:
-                # start a new bank group
-                flush_block()
-                current_bank = bank
-                current_lines = []
-
-            line = (
-                f"{idx:02d}. <b>{html.escape(alias)}</b>  |  "
-                f"<code>{html.escape(masked)}</code>"
-            )
-            current_lines.append(line)
-            idx += 1
+        items = _get_creds_display(app)
 
-        flush_block()
+        # Group by bank and build text blocks; numbering runs across groups.
+        counter = itertools.count(1)
+        messages: List[str] = [
+            f"<b><u>{bank}</u></b>\n"
+            + "\n".join(
+                _LIST_ROW_TEMPLATE % (next(counter), alias, masked)
+                for _, alias, masked in group
+            )
+            for bank, group in itertools.groupby(items, key=itemgetter(0))
+        ]
 
         if not messages:
             await update.message.reply_text("No credentials to display.")
@@ -412,14 +791,14 @@ async def add_alias(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         creds = _get_creds(app)
 
         # Duplicate account number check (same message style as old main.py).
-        for a, c in creds.items():
-            if (c.get("account_number") or "").strip() == account_number.strip():
-                msg = (
-                    "❌ Account number <code>{}</code> is already linked to alias <code>{}</code>.\n"
-                    "Use <code>/edit {}</code> to update that alias instead."
-                ).format(html.escape(account_number), html.escape(a), html.escape(a))
-                await update.message.reply_text(msg, parse_mode=ParseMode.HTML)
-                return
+        a = _get_creds_by_account(app).get(account_number.strip())
+        if a is not None:
+            msg = (
+                "❌ Account number <code>{}</code> is already linked to alias <code>{}</code>.\n"
+                "Use <code>/edit {}</code> to update that alias instead."
+            ).format(html.escape(account_number), html.escape(a), html.escape(a))
+            await update.message.reply_text(msg, parse_mode=ParseMode.HTML)
+            return
 
         if alias in creds:
             await update.message.reply_text(
@@ -431,54 +810,13 @@ async def add_alias(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         settings: Settings = _get_settings(app)
         csv_path = settings.credentials_csv
 
-        parent = os.path.dirname(csv_path)
-        if parent:
-            try:
-                os.makedirs(parent, exist_ok=True)
-            except OSError as e:
-                raise RuntimeError(
-                    f"Failed to prepare credentials file directory '{parent}': {e}"
-                ) from e
-
-        is_new = not os.path.exists(csv_path) or (os.path.getsize(csv_path) == 0)
-
-        try:
-            with open(csv_path, "a", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=[
-                        "alias",
-                        "login_id",
-                        "user_id",
-                        "username",
-                        "password",
-                        "account_number",
-                    ],
-                )
-                if is_new:
-                    writer.writeheader()
-                writer.writerow(
-                    {
-                        "alias": alias,
-                        "login_id": login_id,
-                        "user_id": user_id,
-                        "username": username,
-                        "password": password,
-                        "account_number": account_number,
-                    }
-                )
-        except PermissionError as e:
-            raise RuntimeError(f"No permission to write credentials CSV: {e}") from e
-        except OSError as e:
-            raise RuntimeError(f"Failed to write credentials CSV: {e}") from e
-
-        # Reload creds into memory
-        try:
-            new_creds = load_creds(csv_path)
-        except Exception as e:
-            raise RuntimeError(
-                f"Alias added to file, but failed to reload credentials: {e}"
-            ) from e
+        # File IO and the reload run on a worker thread so a slow disk
+        # doesn't stall other handlers (OTP/CAPTCHA replies etc.)
+        new_creds = await asyncio.to_thread(
+            _append_alias_row_blocking,
+            csv_path,
+            (alias, login_id, user_id, username, password, account_number),
+        )
 
         _set_creds(app, new_creds)
 
@@ -601,7 +939,11 @@ async def handle_alias_text(update: Update, context: ContextTypes.DEFAULT_TYPE)
         app = context.application
 
         try:
-            update_credentials_csv(app, alias, field_key, text)
+            new_creds = await asyncio.to_thread(
+                update_credentials_csv, app, alias, field_key, text
+            )
+            if new_creds is not None:
+                _apply_creds(app, new_creds, alias)
         except ValueError as ve:  # duplicate account number case
             pending_edit.pop(chat_id, None)
             used_alias = "?"
@@ -621,7 +963,8 @@ async def handle_alias_text(update: Update, context: ContextTypes.DEFAULT_TYPE)
             return
         except RuntimeError as e:
             pending_edit.pop(chat_id, None)
-            # Treat CSV / IO failures as "serious" and include full traceback
+            # CSV / IO failures go through the unhandled-exception report (traceback
+            # logged; shown in Telegram only when Settings.debug is set)
             await _notify_unhandled_exception(
                 update,
                 context,
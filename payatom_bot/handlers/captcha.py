@@ -5,35 +5,55 @@ from typing import Dict
 from telegram import Update
 from telegram.ext import ContextTypes, MessageHandler, filters
 
+from ..worker_base import awaiting_workers
+
+_OTP_RE = re.compile(r"\b(\d{6})\b")
+_CAPTCHA_RE = re.compile(r"[A-Za-z0-9]{4,8}")
+
 def _registry(context: ContextTypes.DEFAULT_TYPE) -> Dict[str, object]:
     return context.application.bot_data.setdefault("workers", {})
 
 async def otp_or_captcha(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     text = (update.effective_message.text or "").strip()
-    if not text:
+    if len(text) < 4:
         return
 
     # Prefer a 6-digit numeric (OTP); else accept compact A–Z/0–9 4–8 chars (CAPTCHA)
-    m = re.search(r"\b(\d{6})\b", text)
-    if m:
+    if len(text) == 6 and text.isdecimal():
+        code, as_otp = text, True
+    elif m := _OTP_RE.search(text):
         code, as_otp = m.group(1), True
     else:
         t = text.replace(" ", "")
-        if not re.fullmatch(r"[A-Za-z0-9]{4,8}", t):
+        if not _CAPTCHA_RE.fullmatch(t):
             return
         code, as_otp = t.upper(), False
 
     applied = []
-    for alias, w in list(_registry(context).items()):
-        try:
-            if as_otp and hasattr(w, "otp_code"):
-                setattr(w, "otp_code", code)
+    chat = update.effective_chat
+    waiting = awaiting_workers(chat.id) if chat else {}
+    if waiting:
+        # Only the workers blocked on a Telegram reply get the code.
+        for alias, w in waiting.items():
+            kind = w.awaiting_input
+            if kind == "otp" and as_otp:
+                w.otp_code = code
                 applied.append(f"{alias}: OTP")
-            if hasattr(w, "captcha_code"):
-                setattr(w, "captcha_code", code)
+            elif kind == "captcha":
+                w.captcha_code = code
                 applied.append(f"{alias}: CAPTCHA")
-        except Exception:
-            pass
+    else:
+        # No await in the loop body, so the live dict cannot change under us.
+        for alias, w in _registry(context).items():
+            try:
+                if as_otp and hasattr(w, "otp_code"):
+                    setattr(w, "otp_code", code)
+                    applied.append(f"{alias}: OTP")
+                if hasattr(w, "captcha_code"):
+                    setattr(w, "captcha_code", code)
+                    applied.append(f"{alias}: CAPTCHA")
+            except Exception:
+                pass
 
     if applied:
         await update.effective_message.reply_text("✔️ Applied to " + ", ".join(applied))
@@ -15,6 +15,9 @@ from __future__ import annotations
 
 import re
 import os
+import asyncio
+import functools
+import importlib
 import inspect
 import logging
 from datetime import datetime, timedelta
@@ -23,9 +26,10 @@ from typing import Dict, Optional, List, Any, Tuple
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
 from telegram.constants import ParseMode
+from telegram.helpers import escape_markdown
 
 from ..config import Settings
-from ..captcha_solver import TwoCaptcha
+from ..creds import Credential
 from ..error_handler import (
     telegram_handler_error_wrapper,
     safe_operation,
@@ -33,12 +37,6 @@ from ..error_handler import (
 )
 
 # Workers
-from ..workers.tmb import TMBWorker
-from ..workers.iob import IOBWorker
-from ..workers.kgb import KGBWorker
-from ..workers.idbi import IDBIWorker
-from ..workers.idfc import IDFCWorker
-from ..workers.canara import CanaraWorker
 
 logger = logging.getLogger(__name__)
 
@@ -48,30 +46,66 @@ logger = logging.getLogger(__name__)
 
 def _get_registry(context: ContextTypes.DEFAULT_TYPE) -> Dict[str, object]:
     """Get or create the worker registry from bot_data."""
-    reg = context.application.bot_data.get("workers")
+    bot_data = context.application.bot_data
+    reg = bot_data.get("workers")
     if reg is None:
-        reg = {}
-        context.application.bot_data["workers"] = reg
+        # Only allocate on first use; setdefault("workers", {}) would build
+        # a throwaway dict on every call
+        reg = bot_data["workers"] = {}
     return reg
 
 
+def _snapshot_liveness(workers: Dict[str, Any]) -> Dict[str, bool]:
+    """alias -> is_alive() for every registered worker; failures count as not alive."""
+    alive: Dict[str, bool] = {}
+    for alias, w in workers.items():
+        try:
+            alive[alias] = bool(w.is_alive())
+        except Exception:
+            logger.exception("Failed to check if %s is alive", alias)
+            alive[alias] = False
+    return alive
+
+
+@functools.lru_cache(maxsize=128)
 def _normalize_bank_label(label: str) -> str:
-    """Normalize bank label for consistent comparison."""
+    """Normalize bank label for consistent comparison (cached; few distinct labels)."""
     if not label:
         return ""
     lbl = label.strip().upper().replace("&", "AND")
     return " ".join(lbl.split())
 
 
-WORKER_BY_BANK: Dict[str, Any] = {
-    "TMB": TMBWorker,
-    "IOB": IOBWorker,
-    "IOB CORPORATE": IOBWorker,
-    "KGB": KGBWorker,
-    "KERALA GRAMIN BANK": KGBWorker,
-    "IDBI": IDBIWorker,
-    "IDFC": IDFCWorker,
-    "CANARA": CanaraWorker,
+def _get_bank_by_alias(app: Application) -> Dict[str, str]:
+    """
+    alias -> normalized bank label, rebuilt only when bot_data["creds_by_alias"]
+    is replaced (every credentials reload stores a new dict).
+    """
+    creds_by_alias = app.bot_data.get("creds_by_alias", {})
+    cached = app.bot_data.get("bank_by_alias")
+    if cached is None or cached[0] is not creds_by_alias:
+        cached = (
+            creds_by_alias,
+            {
+                a: _normalize_bank_label(c.get("bank_label", ""))
+                for a, c in creds_by_alias.items()
+            },
+        )
+        app.bot_data["bank_by_alias"] = cached
+    return cached[1]
+
+
+# Bank label -> "module:Class" under payatom_bot.workers. Worker modules (and
+# selenium with them) are only imported when the first worker for a bank starts.
+WORKER_BY_BANK: Dict[str, str] = {
+    "TMB": "tmb:TMBWorker",
+    "IOB": "iob:IOBWorker",
+    "IOB CORPORATE": "iob:IOBWorker",
+    "KGB": "kgb:KGBWorker",
+    "KERALA GRAMIN BANK": "kgb:KGBWorker",
+    "IDBI": "idbi:IDBIWorker",
+    "IDFC": "idfc:IDFCWorker",
+    "CANARA": "canara:CanaraWorker",
 }
 
 _ALIASES = {
@@ -82,17 +116,63 @@ _ALIASES = {
 }
 
 
+# For the "unsupported bank" reply
+_SUPPORTED_BANKS_STR = ", ".join(WORKER_BY_BANK.keys())
+
+_RUN_USAGE_MSG = (
+    "**Usage:**\n"
+    "`/run <alias>` - Start a worker\n"
+    "`/run <alias1> <alias2>` - Start multiple workers\n"
+    "`/run <alias> from dd/mm/yyyy to dd/mm/yyyy` - Start with date range (KGB only)"
+)
+_RUN_RANGE_USAGE_MSG = (
+    "**Usage:**\n"
+    "`/run <alias>` or\n"
+    "`/run <alias> from dd/mm/yyyy to dd/mm/yyyy`"
+)
+_STOP_USAGE_MSG = (
+    "**Usage:**\n"
+    "`/stop <alias>` - Stop a worker\n"
+    "`/stop <alias1> <alias2>` - Stop multiple workers"
+)
+
+# Every accepted (normalized) label -> (worker spec, canonical bank label),
+# so _pick_worker_class needs a single lookup
+_BANK_TO_WORKER: Dict[str, Tuple[str, str]] = {
+    **{lbl: (spec, lbl) for lbl, spec in WORKER_BY_BANK.items()},
+    **{
+        alias: (WORKER_BY_BANK[lbl], lbl)
+        for alias, lbl in _ALIASES.items()
+        if lbl in WORKER_BY_BANK
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_worker_class(spec: str):
+    """Import and return the worker class named by a "module:Class" spec."""
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(f"..workers.{module}", __package__), name)
+
+
+@functools.lru_cache(maxsize=128)
 def _pick_worker_class(bank_label: str):
     """Select the appropriate worker class for a bank label."""
     lbl = _normalize_bank_label(bank_label)
-    lbl = _ALIASES.get(lbl, lbl)
-    return WORKER_BY_BANK.get(lbl), lbl
+    spec, canonical = _BANK_TO_WORKER.get(lbl, (None, lbl))
+    return (_load_worker_class(spec) if spec else None), canonical
+
+
+@functools.lru_cache(maxsize=None)
+def _worker_params(worker_cls) -> frozenset:
+    """Names of the parameters worker_cls.__init__ accepts (cached per class)."""
+    return frozenset(inspect.signature(worker_cls.__init__).parameters)
 
 
 def _instantiate_worker(worker_cls, common_kwargs: Dict[str, Any]):
     """Instantiate a worker with only the parameters it accepts."""
-    sig = inspect.signature(worker_cls.__init__)
-    allowed = {k: v for k, v in common_kwargs.items() if k in sig.parameters}
+    params = _worker_params(worker_cls)
+    allowed = {k: v for k, v in common_kwargs.items() if k in params}
     return worker_cls(**allowed)
 
 
@@ -103,11 +183,22 @@ def _instantiate_worker(worker_cls, common_kwargs: Dict[str, Any]):
 def _parse_date(s: str) -> datetime:
     """Parse date from dd/mm/yyyy or dd/mm/yy format."""
     s = s.strip()
-    for fmt in ("%d/%m/%Y", "%d/%m/%y"):
+    # Split by hand rather than strptime(): same formats, no format parsing
+    parts = s.split("/")
+    if (
+        len(parts) == 3
+        and all(p.isdecimal() for p in parts)
+        and 1 <= len(parts[0]) <= 2
+        and 1 <= len(parts[1]) <= 2
+        and len(parts[2]) in (2, 4)
+    ):
+        d, m, y = map(int, parts)
+        if len(parts[2]) == 2:
+            y += 2000 if y < 69 else 1900  # strptime's %y pivot
         try:
-            return datetime.strptime(s, fmt)
+            return datetime(y, m, d)
         except ValueError:
-            continue
+            pass
     raise ValueError(f"Invalid date format: {s} (expected dd/mm/yyyy)")
 
 
@@ -123,34 +214,36 @@ def _extract_aliases_and_range(
     """
     if not args:
         return [], None
-        
-    try:
-        from_idx = next(i for i, t in enumerate(args) if t.lower() == "from")
-    except StopIteration:
+
+    # One pass up to "from"; aliases are everything before it except "to"
+    aliases: List[str] = []
+    from_idx = -1
+    for i, t in enumerate(args):
+        tl = t.lower()
+        if tl == "from":
+            from_idx = i
+            break
+        if tl != "to":
+            aliases.append(t)
+    if from_idx < 0:
         # No range - all args are aliases
         return args, None
 
-    aliases = [t for t in args[:from_idx] if t.lower() not in {"from", "to"}]
-    
-    try:
-        to_idx = next(
-            i for i, t in enumerate(args[from_idx + 1:], start=from_idx + 1)
-            if t.lower() == "to"
-        )
-    except StopIteration:
+    # Expect exactly: from <date> to <date>
+    rest = args[from_idx + 1:]
+    if len(rest) < 3 or rest[1].lower() != "to" or rest[0].lower() == "to":
+        if any(t.lower() == "to" for t in rest):
+            raise ValueError(
+                "Invalid range format. "
+                "Use: /run <alias> from dd/mm/yyyy to dd/mm/yyyy"
+            )
         raise ValueError(
             "Missing 'to' in date range. "
             "Use: /run <alias> from dd/mm/yyyy to dd/mm/yyyy"
         )
 
-    if to_idx - from_idx != 2 or len(args) <= to_idx + 1:
-        raise ValueError(
-            "Invalid range format. "
-            "Use: /run <alias> from dd/mm/yyyy to dd/mm/yyyy"
-        )
-
-    dt_from = _parse_date(args[from_idx + 1])
-    dt_to = _parse_date(args[to_idx + 1])
+    dt_from = _parse_date(rest[0])
+    dt_to = _parse_date(rest[2])
     
     if dt_to < dt_from:
         raise ValueError("'to' date cannot be before 'from' date")
@@ -170,9 +263,11 @@ def _mask_acct(acct: str | int | None) -> str:
 
 def _format_ago(delta: timedelta) -> str:
     """Format timedelta as human-readable string (e.g., '2h 15m 30s')."""
-    total = int(delta.total_seconds())
-    if total < 0:
-        total = 0
+    return _format_ago_seconds(max(int(delta.total_seconds()), 0))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_ago_seconds(total: int) -> str:
     mins, secs = divmod(total, 60)
     hours, mins = divmod(mins, 60)
     
@@ -209,7 +304,7 @@ def start_worker_for_alias(
         app = context.application
         settings: Settings = app.bot_data["settings"]
         messenger = app.bot_data["messenger"]
-        creds_by_alias: Dict[str, dict] = app.bot_data.get("creds_by_alias", {})
+        creds_by_alias: Dict[str, Credential] = app.bot_data.get("creds_by_alias", {})
 
         alias = alias.strip()
         if not alias:
@@ -224,7 +319,7 @@ def start_worker_for_alias(
         
         # Check if already running
         if existing and safe_operation(
-            lambda: existing.is_alive(),
+            existing.is_alive,
             context=f"check if {alias} is alive",
             default=False
         ):
@@ -235,7 +330,7 @@ def start_worker_for_alias(
         if not worker_cls:
             return (
                 f"⏸️ `{alias}` uses unsupported bank `{cred.get('bank_label', 'unknown')}`.\n"
-                f"Supported banks: {', '.join(WORKER_BY_BANK.keys())}"
+                f"Supported banks: {_SUPPORTED_BANKS_STR}"
             )
 
         # Build profile directory
@@ -249,7 +344,7 @@ def start_worker_for_alias(
             cred=cred,
             messenger=messenger,
             profile_dir=profile_dir,
-            two_captcha=TwoCaptcha(settings.two_captcha_key) if settings.two_captcha_key else None,
+            two_captcha=app.bot_data.get("two_captcha"),
         )
 
         # Instantiate and configure worker
@@ -257,8 +352,13 @@ def start_worker_for_alias(
             worker = _instantiate_worker(worker_cls, common_kwargs)
             
             # Apply date range for KGB workers
-            if isinstance(worker, KGBWorker) and date_range:
-                worker.from_dt, worker.to_dt = date_range
+            kgb_range = (
+                date_range
+                if date_range and isinstance(worker, _load_worker_class(WORKER_BY_BANK["KGB"]))
+                else None
+            )
+            if kgb_range:
+                worker.from_dt, worker.to_dt = kgb_range
                 
             worker.start()
             workers[alias] = worker
@@ -273,8 +373,8 @@ def start_worker_for_alias(
             )
 
         # Success message
-        if isinstance(worker, KGBWorker) and date_range:
-            f, t = date_range
+        if kgb_range:
+            f, t = kgb_range
             return (
                 f"✅ Started `{alias}` ({norm_bank})\n"
                 f"📅 Date range: {f:%d/%m/%Y} → {t:%d/%m/%Y}"
@@ -300,20 +400,14 @@ async def run_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         aliases, dr = _extract_aliases_and_range(context.args or [])
     except ValueError as e:
         await update.message.reply_text(
-            f"❌ {e}\n\n"
-            f"**Usage:**\n"
-            f"`/run <alias>` or\n"
-            f"`/run <alias> from dd/mm/yyyy to dd/mm/yyyy`",
+            f"❌ {e}\n\n{_RUN_RANGE_USAGE_MSG}",
             parse_mode="Markdown"
         )
         return
 
     if not aliases:
         await update.message.reply_text(
-            "**Usage:**\n"
-            "`/run <alias>` - Start a worker\n"
-            "`/run <alias1> <alias2>` - Start multiple workers\n"
-            "`/run <alias> from dd/mm/yyyy to dd/mm/yyyy` - Start with date range (KGB only)",
+            _RUN_USAGE_MSG,
             parse_mode="Markdown"
         )
         return
@@ -331,9 +425,7 @@ async def stop_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """/stop <alias> [<alias2> ...]"""
     if not context.args:
         await update.message.reply_text(
-            "**Usage:**\n"
-            "`/stop <alias>` - Stop a worker\n"
-            "`/stop <alias1> <alias2>` - Stop multiple workers",
+            _STOP_USAGE_MSG,
             parse_mode="Markdown"
         )
         return
@@ -346,7 +438,7 @@ async def stop_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         w = workers.get(alias)
         
         if not w or not safe_operation(
-            lambda: w.is_alive(),
+            w.is_alive,
             context=f"check if {alias} is alive",
             default=False
         ):
@@ -401,6 +493,11 @@ async def status_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         )
 
 
+def _stop_and_join(w, timeout: float = 5.0) -> None:
+    w.stop()
+    w.join(timeout=timeout)
+
+
 @telegram_handler_error_wrapper
 async def stopall_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """/stopall - Stop all running workers"""
@@ -408,23 +505,24 @@ async def stopall_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
     stopped = []
     errors = []
     
-    for alias, w in list(workers.items()):
-        try:
-            if safe_operation(
-                lambda: w.is_alive(),
-                context=f"check if {alias} is alive",
-                default=False
-            ):
-                w.stop()
-                w.join(timeout=5.0)
-                stopped.append(alias)
-                logger.info("Stopped worker: %s", alias)
-        except Exception as e:
-            logger.exception("Error stopping worker %s", alias)
+    alive = _snapshot_liveness(workers)
+    targets = [(alias, w) for alias, w in workers.items() if alive[alias]]
+    workers.clear()
+
+    # Stop them side by side on worker threads: the wait is bounded by the
+    # slowest browser shutdown rather than the sum, and the loop stays free
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_stop_and_join, w) for _, w in targets),
+        return_exceptions=True,
+    )
+    for (alias, _), result in zip(targets, results):
+        if isinstance(result, Exception):
+            logger.error("Error stopping worker %s", alias, exc_info=result)
             errors.append(alias)
-        finally:
-            workers.pop(alias, None)
-            
+        else:
+            stopped.append(alias)
+            logger.info("Stopped worker: %s", alias)
+
     if not stopped and not errors:
         await update.message.reply_text(
             "ℹ️ No workers were running",
@@ -443,14 +541,7 @@ async def stopall_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
 async def running_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """/running - List all running workers"""
     workers = _get_registry(context)
-    active = [
-        a for a, w in workers.items()
-        if safe_operation(
-            lambda: w.is_alive(),
-            context=f"check if {a} is alive",
-            default=False
-        )
-    ]
+    active = [a for a, is_alive in _snapshot_liveness(workers).items() if is_alive]
     
     if not active:
         await update.message.reply_text(
@@ -459,11 +550,11 @@ async def running_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         )
         return
 
-    creds_by_alias: Dict[str, dict] = context.application.bot_data.get("creds_by_alias", {})
+    bank_by_alias = _get_bank_by_alias(context.application)
     decorated = []
     
     for a in active:
-        bank = _normalize_bank_label(creds_by_alias.get(a, {}).get("bank_label", ""))
+        bank = bank_by_alias.get(a, "")
         decorated.append(f"`{a}` ({bank})" if bank else f"`{a}`")
 
     await update.message.reply_text(
@@ -481,14 +572,8 @@ async def active_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
     Highlights workers that haven't uploaded in >5 minutes as potential issues.
     """
     workers = _get_registry(context)
-    running = {
-        alias: w for alias, w in workers.items()
-        if safe_operation(
-            lambda: w.is_alive(),
-            context=f"check if {alias} is alive",
-            default=False
-        )
-    }
+    alive = _snapshot_liveness(workers)
+    running = {alias: w for alias, w in workers.items() if alive[alias]}
     
     if not running:
         await update.message.reply_text(
@@ -497,29 +582,27 @@ async def active_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         )
         return
 
-    creds_by_alias: Dict[str, dict] = context.application.bot_data.get("creds_by_alias", {})
+    bank_by_alias = _get_bank_by_alias(context.application)
     now = datetime.now()
-    threshold = timedelta(minutes=5)
+    threshold = 5 * 60  # seconds
 
     ok_lines: List[str] = []
     bad_lines: List[str] = []
 
     for alias, w in running.items():
-        bank = _normalize_bank_label(creds_by_alias.get(alias, {}).get("bank_label", ""))
+        bank = bank_by_alias.get(alias, "")
         label = f"`{alias}`" + (f" ({bank})" if bank else "")
 
-        last_upload = safe_operation(
-            lambda: w.last_upload_at,
-            context=f"get last_upload_at for {alias}",
-            default=None
-        )
+        last_upload = getattr(w, "last_upload_at", None)
         
         if not last_upload:
             bad_lines.append(f"❌ {label} — no AutoBank upload recorded yet")
             continue
 
-        age = now - last_upload
-        ago_str = _format_ago(age)
+        # Work in float seconds: a plain float compare instead of
+        # timedelta.__gt__, and the int feeds _format_ago_seconds' cache
+        age = (now - last_upload).total_seconds()
+        ago_str = _format_ago_seconds(max(int(age), 0))
         last_str = last_upload.strftime("%H:%M:%S")
 
         if age > threshold:
@@ -551,7 +634,7 @@ async def balance_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
     /balance <alias>... - Show balances for specific aliases
     """
     workers = _get_registry(context)
-    creds_by_alias: Dict[str, dict] = context.application.bot_data.get("creds_by_alias", {})
+    creds_by_alias: Dict[str, Credential] = context.application.bot_data.get("creds_by_alias", {})
 
     targets = context.args if context.args else list(workers.keys())
     
@@ -564,28 +647,21 @@ async def balance_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
 
     lines: list[str] = []
     
+    alive = _snapshot_liveness(workers)
     for alias in targets:
         w = workers.get(alias)
         
-        if not w or not safe_operation(
-            lambda: w.is_alive(),
-            context=f"check if {alias} is alive",
-            default=False
-        ):
+        if not w or not alive.get(alias, False):
             lines.append(f"`{alias}` — not running")
             continue
 
         cred = creds_by_alias.get(alias, {})
         bank = cred.get("bank_label", "?")
-        bal = safe_operation(
-            lambda: w.last_balance,
-            context=f"get balance for {alias}",
-            default="loading..."
-        ) or "loading..."
+        bal = getattr(w, "last_balance", "loading...") or "loading..."
 
         # Escape special Markdown characters
-        safe_alias = alias.replace("_", r"\_").replace("*", r"\*")
-        safe_balance = bal.replace("_", r"\_").replace("*", r"\*")
+        safe_alias = escape_markdown(alias, version=1)
+        safe_balance = escape_markdown(bal, version=1)
 
         lines.append(f"**{safe_alias}** ({bank}) | 💰 **{safe_balance}**")
 
@@ -606,7 +682,8 @@ async def alerts_status_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE)
     - Check interval
     - Current alerts for each alias
     """
-    balance_monitor = context.application.bot_data.get("balance_monitor")
+    bot_data = context.application.bot_data
+    balance_monitor = bot_data.get("balance_monitor")
     
     if not balance_monitor:
         await update.message.reply_text(
@@ -638,13 +715,14 @@ async def alerts_status_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE)
     ]
     
     # Show triggered alerts per alias
-    if balance_monitor.triggered_thresholds:
+    triggered = balance_monitor.triggered_thresholds
+    if triggered:
         lines.append("**🔔 Active Alerts:**")
         
-        creds_by_alias = context.application.bot_data.get("creds_by_alias", {})
+        creds_by_alias = bot_data.get("creds_by_alias", {})
         
-        for alias in sorted(balance_monitor.triggered_thresholds.keys()):
-            thresholds = sorted(balance_monitor.triggered_thresholds[alias])
+        for alias, hit in sorted(triggered.items()):
+            thresholds = sorted(hit)
             cred = creds_by_alias.get(alias, {})
             bank = cred.get("bank_label", "")
             
@@ -739,9 +817,10 @@ async def check_balances_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE)
     """
     from ..balance_monitor import parse_balance_amount, THRESHOLDS
     
+    bot_data = context.application.bot_data
     workers = _get_registry(context)
-    creds_by_alias = context.application.bot_data.get("creds_by_alias", {})
-    balance_monitor = context.application.bot_data.get("balance_monitor")
+    creds_by_alias = bot_data.get("creds_by_alias", {})
+    balance_monitor = bot_data.get("balance_monitor")
     
     targets = context.args if context.args else list(workers.keys())
     
@@ -754,25 +833,18 @@ async def check_balances_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE)
     
     lines = ["💰 **Balance Status Check**\n"]
     
+    alive = _snapshot_liveness(workers)
     for alias in targets:
         w = workers.get(alias)
         
-        if not w or not safe_operation(
-            lambda: w.is_alive(),
-            context=f"check if {alias} is alive",
-            default=False
-        ):
+        if not w or not alive.get(alias, False):
             lines.append(f"⚪ `{alias}` - not running")
             continue
         
         cred = creds_by_alias.get(alias, {})
         bank = cred.get("bank_label", "?")
         
-        balance_str = safe_operation(
-            lambda: w.last_balance,
-            context=f"get balance for {alias}",
-            default="N/A"
-        ) or "N/A"
+        balance_str = getattr(w, "last_balance", "N/A") or "N/A"
         
         # Parse numeric balance
         balance_num = parse_balance_amount(balance_str)
@@ -930,12 +1002,15 @@ def register_session_handlers(app: Application, settings: Settings) -> None:
     app.add_handler(CommandHandler("active", active_cmd))
     app.add_handler(CommandHandler("balance", balance_cmd))
 
-    logger.info("Registered session management handlers")
-
-    # NEW: Balance/file alert management commands
+    # Balance/file alert management commands
     app.add_handler(CommandHandler("file", file_cmd))
     app.add_handler(CommandHandler("alerts", alerts_status_cmd))
     app.add_handler(CommandHandler("reset_alerts", reset_alerts_cmd))
     app.add_handler(CommandHandler("balances", check_balances_cmd))
-    
+
+    # One 2Captcha client (and its keep-alive session) shared by every worker
+    if settings.two_captcha_key:
+        from ..captcha_solver import TwoCaptcha
+        app.bot_data["two_captcha"] = TwoCaptcha(settings.two_captcha_key)
+
     logger.info("Registered session management handlers (including balance alerts)")
\ No newline at end of file
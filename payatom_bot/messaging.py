@@ -23,7 +23,7 @@ class Messenger:
         *,
         bot: Bot,
         chat_id: int,
-        loop: asyncio.AbstractEventLoop,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
         debug: bool = True
     ):
         self.bot = bot
@@ -43,7 +43,17 @@ class Messenger:
         self.debug = on
         logger.info("Messenger debug mode: %s", "ON" if on else "OFF")
 
+    async def bind_loop(self) -> None:
+        """Bind to the running event loop (await this from the application loop)."""
+        self.loop = asyncio.get_running_loop()
+
     # —— internal ——
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the bound loop, resolving it lazily when called on the loop thread."""
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        return self.loop
+
     def _schedule_flush(self) -> None:
         """Schedule a flush of buffered messages."""
         if self._closed:
@@ -53,7 +63,7 @@ class Messenger:
             return
         # schedule a one-shot callback that will run in loop thread
         try:
-            self._flush_timer = self.loop.call_later(60.0, self._flush_now_threadsafe)
+            self._flush_timer = self._get_loop().call_later(60.0, self._flush_now_threadsafe)
         except Exception as e:
             logger.error("Failed to schedule flush: %s", e)
 
@@ -67,7 +77,7 @@ class Messenger:
         
         fut = asyncio.run_coroutine_threadsafe(
             self._send_message_with_retry(text, ParseMode.HTML),
-            self.loop
+            self._get_loop()
         )
         
         def handle_result(f):
@@ -161,6 +171,10 @@ class Messenger:
         logger.info("Messenger closed")
 
     # —— public (thread-safe) ——
+    def should_send(self) -> bool:
+        """Whether send_event would deliver (or buffer) an event right now."""
+        return not self._closed
+
     def send_event(self, text: str, kind: str = "INFO"):
         """
         Send an event message to Telegram.
@@ -180,7 +194,7 @@ class Messenger:
             try:
                 fut = asyncio.run_coroutine_threadsafe(
                     self._send_message_with_retry(text, ParseMode.HTML),
-                    self.loop
+                    self._get_loop()
                 )
                 
                 def handle_result(f):
@@ -221,7 +235,7 @@ class Messenger:
             try:
                 fut = asyncio.run_coroutine_threadsafe(
                     self._send_photo_with_retry(photo, caption),
-                    self.loop
+                    self._get_loop()
                 )
                 
                 def handle_result(f):
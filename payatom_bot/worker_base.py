@@ -4,18 +4,25 @@ import traceback
 import os
 import time
 import threading
+from contextlib import contextmanager
 from io import BytesIO
-from typing import Optional, Callable
+from typing import Dict, Iterator, Optional, Callable
 from datetime import datetime  # 🔹 NEW
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-
+from .creds import Credential
 from .messaging import Messenger
 
+# chat_id -> {alias: worker} for workers blocked on a code typed into Telegram.
+# Written from worker threads, read by handlers/captcha.py on the event loop.
+_awaiting_input: Dict[int, Dict[str, "BaseWorker"]] = {}
+_awaiting_lock = threading.Lock()
+
+
+def awaiting_workers(chat_id: int) -> Dict[str, "BaseWorker"]:
+    """Snapshot of the workers in `chat_id` currently waiting for an OTP/CAPTCHA."""
+    with _awaiting_lock:
+        return dict(_awaiting_input.get(chat_id) or {})
+
 
 class BaseWorker(threading.Thread):
     """
@@ -32,7 +39,7 @@ class BaseWorker(threading.Thread):
         bot,
         chat_id: int,
         alias: str,
-        cred: dict,
+        cred: Credential,
         messenger: Messenger,
         profile_dir: str,
     ):
@@ -47,11 +54,15 @@ class BaseWorker(threading.Thread):
         self.stop_evt = threading.Event()
         self.last_balance: Optional[str] = None
         self.last_upload_at: Optional[datetime] = None  # 🔹 NEW: last AutoBank upload time
+        self.awaiting_input: Optional[str] = None  # "otp" / "captcha" while blocked on Telegram
 
         download_root = os.path.join(os.getcwd(), "downloads", alias)
         os.makedirs(download_root, exist_ok=True)
         self.download_dir = download_root
 
+        # Imported here so the awaiting-input registry above stays selenium-free
+        from selenium import webdriver
+
         opts = webdriver.ChromeOptions()
         # opts.add_argument("--headless=new")
         # opts.add_argument("--disable-gpu")
@@ -105,6 +116,26 @@ class BaseWorker(threading.Thread):
         except Exception:
             pass
 
+    @contextmanager
+    def awaiting(self, kind: str) -> Iterator[None]:
+        """
+        Mark this worker as waiting for a Telegram reply ("otp" or "captcha")
+        so captcha.py hands the next code to it instead of every worker.
+        """
+        self.awaiting_input = kind
+        with _awaiting_lock:
+            _awaiting_input.setdefault(self.chat_id, {})[self.alias] = self
+        try:
+            yield
+        finally:
+            self.awaiting_input = None
+            with _awaiting_lock:
+                waiting = _awaiting_input.get(self.chat_id)
+                if waiting is not None and waiting.get(self.alias) is self:
+                    del waiting[self.alias]
+                    if not waiting:
+                        del _awaiting_input[self.chat_id]
+
     # ———————————————————
     # Retry wrapper
     # ———————————————————
@@ -188,13 +188,14 @@ class CanaraWorker(BaseWorker):
             )
             self.info("Waiting up to 180s for manual CAPTCHA via Telegram…")
 
-            deadline = time.time() + 180
-            while not self.stop_evt.is_set() and time.time() < deadline:
-                # captcha.py will set self.captcha_code for ANY 4–8 A–Z/0–9 text
-                if self.captcha_code:
-                    solved = self.captcha_code.strip()
-                    break
-                time.sleep(0.5)
+            with self.awaiting("captcha"):
+                deadline = time.time() + 180
+                while not self.stop_evt.is_set() and time.time() < deadline:
+                    # captcha.py routes the next 4–8 A–Z/0–9 reply here while we wait
+                    if self.captcha_code:
+                        solved = self.captcha_code.strip()
+                        break
+                    time.sleep(0.5)
 
             if not solved:
                 raise TimeoutException("CAPTCHA not solved (manual entry timeout)")
@@ -326,53 +327,54 @@ class CanaraWorker(BaseWorker):
             EC.presence_of_element_located((By.ID, "otp|input"))
         )
 
-        while not self.stop_evt.is_set():
-            # captcha.py sets otp_code for ANY 6-digit number in any message
-            if not self.otp_code:
-                time.sleep(0.5)
-                continue
+        with self.awaiting("otp"):
+            while not self.stop_evt.is_set():
+                # captcha.py routes the next 6-digit code here while we wait
+                if not self.otp_code:
+                    time.sleep(0.5)
+                    continue
 
-            code = self.otp_code.strip()
-            self.otp_code = None  # consume
+                code = self.otp_code.strip()
+                self.otp_code = None  # consume
 
-            otp_input.clear()
-            otp_input.send_keys(code)
+                otp_input.clear()
+                otp_input.send_keys(code)
 
-            submit_btn = self._find_clickable_by_span_text("Submit")
-            if not submit_btn:
-                raise TimeoutException("Submit button not found on OTP page")
-            self._safe_click(submit_btn)
+                submit_btn = self._find_clickable_by_span_text("Submit")
+                if not submit_btn:
+                    raise TimeoutException("Submit button not found on OTP page")
+                self._safe_click(submit_btn)
 
-            # Check for invalid OTP popup (e9 + e10)
-            try:
-                msg_span = WebDriverWait(d, 5).until(
-                    EC.presence_of_element_located(
-                        (
-                            By.XPATH,
-                            "//span[contains(@data-bind,'modalMessage')]",
+                # Check for invalid OTP popup (e9 + e10)
+                try:
+                    msg_span = WebDriverWait(d, 5).until(
+                        EC.presence_of_element_located(
+                            (
+                                By.XPATH,
+                                "//span[contains(@data-bind,'modalMessage')]",
+                            )
                         )
                     )
-                )
-                text = (msg_span.text or "").strip().lower()
-                if "invalid" in text:
-                    self.info("❌ OTP invalid. Waiting for a new OTP…")
-                    try:
-                        ok_btn = WebDriverWait(d, 5).until(
-                            EC.element_to_be_clickable(
-                                (
-                                    By.XPATH,
-                                    "//span[normalize-space(text())='Okay']"
-                                    "/ancestor::*[self::button or @role='button']",
+                    text = (msg_span.text or "").strip().lower()
+                    if "invalid" in text:
+                        self.info("❌ OTP invalid. Waiting for a new OTP…")
+                        try:
+                            ok_btn = WebDriverWait(d, 5).until(
+                                EC.element_to_be_clickable(
+                                    (
+                                        By.XPATH,
+                                        "//span[normalize-space(text())='Okay']"
+                                        "/ancestor::*[self::button or @role='button']",
+                                    )
                                 )
                             )
-                        )
-                        self._safe_click(ok_btn)
-                    except TimeoutException:
-                        pass
-                    continue  # wait for new OTP
-            except TimeoutException:
-                # No modal: assume OTP accepted → continue
-                break
+                            self._safe_click(ok_btn)
+                        except TimeoutException:
+                            pass
+                        continue  # wait for new OTP
+                except TimeoutException:
+                    # No modal: assume OTP accepted → continue
+                    break
 
         if self.stop_evt.is_set():
             raise TimeoutException("Worker stopped while waiting for OTP")
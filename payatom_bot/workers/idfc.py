@@ -112,11 +112,12 @@ class IDFCWorker(BaseWorker):
 
         # e5–e6: OTP via Telegram
         self.info("🔐 Waiting for 6-digit OTP (send it in Telegram)…")
-        start = time.time()
-        while self.otp_code is None and not self.stop_evt.is_set():
-            if time.time() - start > 300:  # 5-min expiry
-                raise TimeoutException("OTP expired — restarting login")
-            time.sleep(0.5)
+        with self.awaiting("otp"):
+            start = time.time()
+            while self.otp_code is None and not self.stop_evt.is_set():
+                if time.time() - start > 300:  # 5-min expiry
+                    raise TimeoutException("OTP expired — restarting login")
+                time.sleep(0.5)
         if self.stop_evt.is_set():
             return
 